@@ -2,27 +2,864 @@
 Bedrock을 활용한 AI 분석 리포트 생성
 """
 import boto3
+import hashlib
 import json
+import logging
+import orjson
+import re
+import threading
+import time
+import weakref
 import pandas as pd
+from botocore.config import Config as BotoConfig
+from collections import OrderedDict
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# AI 시뮬레이션 응답에서 ```json ... ``` 블록 추출 (호출마다 재컴파일하지 않도록 모듈 로드 시 한 번 컴파일)
+_JSON_BLOCK_RE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+
+
+class _ResponseCache:
+    """프로세스 내 응답 캐시 (완전 일치 키 + TTL + LRU 크기 제한)
+    
+    동일한 프롬프트/쿼리로 리포트를 다시 생성할 때 Bedrock·KB 재호출을 생략합니다.
+    데이터가 바뀌면 프롬프트도 바뀌므로 키가 달라져 자연스럽게 무효화됩니다.
+    max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+    
+    def __init__(self, ttl, max_entries=0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._store = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(*parts):
+        # 프롬프트 전체가 키에 포함되므로 orjson으로 직렬화 (긴 한국어 문자열에서 json.dumps보다 빠름)
+        return hashlib.sha256(orjson.dumps(parts, default=str)).hexdigest()
+    
+    def get(self, key):
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._store[key]
+                return None
+            self._store.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._store[key] = (time.monotonic(), value)
+            self._store.move_to_end(key)
+            if self.max_entries > 0:
+                while len(self._store) > self.max_entries:
+                    self._store.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+
+
+_response_cache = _ResponseCache(Config.RESPONSE_CACHE_TTL, Config.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+class _RateLimiter:
+    """Bedrock 호출 속도 제한 (분당 요청 수 / 분당 토큰 수 토큰 버킷)
+    
+    병렬 호출이 Bedrock 쿼터를 넘어 ThrottlingException → 재시도 대기가 생기기 전에
+    클라이언트에서 미리 호출 간격을 조절합니다. 한도가 0이면 해당 제한은 비활성화됩니다.
+    """
+    
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm > 0:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm > 0:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+    
+    def acquire(self, tokens=0):
+        """요청 1건 + 예상 토큰만큼 여유가 생길 때까지 대기"""
+        if self.rpm <= 0 and self.tpm <= 0:
+            return
+        if self.tpm > 0:
+            tokens = min(tokens, self.tpm)
+        
+        while True:
+            with self._lock:
+                self._refill()
+                request_ok = self.rpm <= 0 or self._requests >= 1
+                tokens_ok = self.tpm <= 0 or self._tokens >= tokens
+                if request_ok and tokens_ok:
+                    if self.rpm > 0:
+                        self._requests -= 1
+                    if self.tpm > 0:
+                        self._tokens -= tokens
+                    return
+                wait = 0
+                if not request_ok:
+                    wait = (1 - self._requests) * 60 / self.rpm
+                if not tokens_ok:
+                    wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+            time.sleep(wait)
+
+
+_bedrock_limiter = _RateLimiter(Config.BEDROCK_RPM, Config.BEDROCK_TPM)
+
+
+def _estimate_tokens(body, max_tokens):
+    """요청 토큰 추정치 (요청 본문 약 4바이트 ≈ 1토큰 + 최대 출력 토큰)"""
+    return len(body) // 4 + max_tokens
+
+
+# boto3 클라이언트는 스레드 안전하므로 프로세스 전체에서 공유
+# (인스턴스마다 생성하면 클라이언트당 수백 ms + 커넥션 풀 재생성 비용 발생)
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(service_name):
+    """서비스별 boto3 클라이언트 싱글톤 반환 (최초 호출 시 생성)"""
+    client = _clients.get(service_name)
+    if client is not None:
+        return client
+    with _clients_lock:
+        if service_name not in _clients:
+            _clients[service_name] = boto3.client(
+                service_name,
+                region_name=Config.AWS_REGION,
+                aws_access_key_id=Config.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=Config.AWS_SECRET_ACCESS_KEY,
+                config=BotoConfig(
+                    max_pool_connections=Config.BOTO_MAX_POOL_CONNECTIONS,
+                    retries={'max_attempts': Config.BOTO_MAX_ATTEMPTS, 'mode': 'adaptive'},
+                    connect_timeout=Config.BOTO_CONNECT_TIMEOUT,
+                    read_timeout=Config.BOTO_READ_TIMEOUT,
+                    tcp_keepalive=True
+                )
+            )
+        return _clients[service_name]
+
+
+def _column(df, name, default=None):
+    """컬럼 Series 반환 (컬럼이 없으면 default로 채움 - row.get(name, default)와 동일)"""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def _to_int(series):
+    """숫자 변환 불가 값/결측값을 0으로 처리한 int64 Series"""
+    return pd.to_numeric(series, errors='coerce').fillna(0).astype('int64')
+
+
+def _to_float(series):
+    """숫자 변환 불가 값/결측값을 0.0으로 처리한 float64 Series"""
+    return pd.to_numeric(series, errors='coerce').fillna(0.0).astype('float64')
+
+
+# DataFrame별 파생 결과 캐시 (같은 데이터로 여러 리포트를 만들 때 재계산 방지)
+_FRAME_CACHE_SIZE = 16
+_frame_cache = OrderedDict()
+_frame_cache_lock = threading.Lock()
+
+
+def _cached_for_frame(df, name, compute):
+    """df에서 계산한 결과를 (DataFrame, name) 단위로 캐시
+    
+    id(df)로 찾고 weakref로 원본을 확인하므로 DataFrame이 해제된 뒤 재사용된 id에
+    잘못된 결과가 돌아가지 않습니다. (리포트 생성 중 원본 DataFrame은 수정하지 않는다는 전제)
+    """
+    key = (id(df), name)
+    with _frame_cache_lock:
+        entry = _frame_cache.get(key)
+        if entry is not None and entry[0]() is df:
+            _frame_cache.move_to_end(key)
+            return entry[1]
+    
+    value = compute(df)
+    with _frame_cache_lock:
+        _frame_cache[key] = (weakref.ref(df), value)
+        _frame_cache.move_to_end(key)
+        while len(_frame_cache) > _FRAME_CACHE_SIZE:
+            _frame_cache.popitem(last=False)
+    return value
+
+
+_TOP_N_DEPTH = 15
+
+
+def _top_by_chargers(df, n):
+    """총충전기 상위 n개 행 (df.nlargest(n, '총충전기')와 동일)
+    
+    DataFrame별로 상위 _TOP_N_DEPTH개를 한 번만 정렬해 두고 head(n)으로 잘라 재사용합니다.
+    """
+    if n > _TOP_N_DEPTH:
+        return df.nlargest(n, '총충전기')
+    top = _cached_for_frame(df, 'top_chargers', lambda d: d.nlargest(_TOP_N_DEPTH, '총충전기'))
+    return top.head(n)
+
+
+def _month_rows(df, month):
+    """특정 snapshot_month 행 (df[df['snapshot_month'] == month]와 동일, 원래 행 순서/인덱스 유지)
+    
+    DataFrame별로 월 → 행 위치 인덱스를 한 번만 만들어 두어 기준월을 바꿔가며 조회해도 전체 스캔을 반복하지 않습니다.
+    """
+    positions = _cached_for_frame(
+        df,
+        'month_positions',
+        lambda d: d.groupby('snapshot_month', sort=False, observed=True).indices
+    )
+    if month not in positions:
+        return df.iloc[0:0]
+    return df.take(positions[month])
+
+
+def _monthly_totals(df):
+    """월별 충전소/충전기 합계 (snapshot_month 인덱스, 월 순 정렬)"""
+    return _cached_for_frame(
+        df,
+        'monthly_totals',
+        lambda d: d.groupby('snapshot_month', sort=True, observed=True)[
+            ['충전소수', '완속충전기', '급속충전기', '총충전기']
+        ].sum()
+    )
+
+
+def _gs_rows(df):
+    """GS차지비 행 (CPO명 컬럼이 없으면 None)
+    
+    여러 리포트가 같은 DataFrame에서 GS차지비 행을 반복해서 찾으므로 DataFrame별로 한 번만 필터링합니다.
+    """
+    if 'CPO명' not in df.columns:
+        return None
+    return _cached_for_frame(df, 'gs_rows', lambda d: d[d['CPO명'] == 'GS차지비'])
+
+
+def _gs_monthly(df):
+    """GS차지비 월별 행 (snapshot_month 순 정렬, CPO명 컬럼이 없으면 None)"""
+    if 'CPO명' not in df.columns:
+        return None
+    return _cached_for_frame(df, 'gs_monthly', lambda d: _gs_rows(d).sort_values('snapshot_month'))
+
+
+def _gs_row(df):
+    """GS차지비 첫 행을 dict로 반환 (없으면 None, 여러 리포트가 공유하므로 수정하지 말 것)"""
+    gs_rows = _gs_rows(df)
+    if gs_rows is None or len(gs_rows) == 0:
+        return None
+    return _cached_for_frame(df, 'gs_row', lambda d: _gs_rows(d).iloc[0].to_dict())
+
+
+def _gs_status_block(gs_row, target_month):
+    """GS차지비 기준월 현황 공통 블록 (순위/충전소/충전기/점유율)"""
+    return f"""
+GS차지비 {target_month} 현황:
+- 순위: {gs_row.get('순위', 'N/A')}위
+- 충전소 수: {gs_row.get('충전소수', 'N/A')}개
+- 완속충전기: {gs_row.get('완속충전기', 'N/A')}기
+- 급속충전기: {gs_row.get('급속충전기', 'N/A')}기
+- 총충전기: {gs_row.get('총충전기', 'N/A')}기
+- 시장점유율: {gs_row.get('시장점유율', 'N/A')}
+"""
+
+
+def _gs_data_issue(df, target_month):
+    """GS차지비 관점 리포트를 만들 수 없는 사유 (문제없으면 None)"""
+    gs_rows = _gs_rows(df)
+    if gs_rows is None:
+        return f'{target_month} 데이터에 CPO명 컬럼이 없습니다.'
+    if len(gs_rows) == 0:
+        return f'{target_month} 데이터에 GS차지비 현황이 없습니다.'
+    return None
+
+
+def _insufficient_data_report(reason):
+    """데이터 부족 시 Bedrock 호출 대신 반환하는 리포트 본문"""
+    return f"## 데이터 부족\n\n{reason}\n\n기준월 또는 분석 기간을 변경한 뒤 다시 생성해주세요."
+
+
+def _ratio(numerator, denominator, scale=1):
+    """Series 비율 (분모가 0 이하인 행은 0)"""
+    return (numerator / denominator * scale).where(denominator > 0, 0.0)
+
+
+def _optional_int(value):
+    """결측값은 None, 그 외는 int로 변환"""
+    return int(value) if pd.notna(value) else None
+
+
+def _share_percents(series):
+    """시장점유율 컬럼을 % 단위 float 리스트로 변환 (1 미만이면 비율로 보고 100배, 결측값은 None)
+    
+    행마다 분기하지 않고 컬럼 전체를 한 번에 변환합니다.
+    """
+    values = pd.to_numeric(series, errors='coerce')
+    percents = values.where(values >= 1, values * 100).astype(object)
+    return percents.where(values.notna(), None).tolist()
+
+
+def _json_default(obj):
+    """orjson이 기본 지원하지 않는 타입 변환 (DataFrame/Series/Timestamp 등)"""
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict(orient='records')
+    if isinstance(obj, pd.Series):
+        return obj.to_dict()
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if hasattr(obj, 'item'):  # numpy 스칼라
+        return obj.item()
+    return str(obj)
+
+
+def _to_table(obj):
+    """레코드 리스트/DataFrame을 {'columns': [...], 'rows': [[...]]} 형태로 변환
+    
+    records 형식은 행마다 같은 키가 반복되어 토큰을 낭비하므로 컬럼명은 한 번만 싣습니다.
+    """
+    if isinstance(obj, pd.DataFrame):
+        return {
+            'columns': [str(c) for c in obj.columns],
+            'rows': obj.to_numpy(dtype=object).tolist()
+        }
+    if isinstance(obj, dict):
+        return {k: _to_table(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        if len(obj) >= 2 and all(isinstance(v, dict) for v in obj):
+            columns = list(obj[0].keys())
+            if all(list(v.keys()) == columns for v in obj[1:]):
+                return {
+                    'columns': columns,
+                    'rows': [[_to_table(v[c]) for c in columns] for v in obj]
+                }
+        return [_to_table(v) for v in obj]
+    return obj
+
+
+def _shrink(obj, max_items):
+    """긴 리스트/DataFrame을 앞뒤 일부만 남기고 축약 (pandas repr과 같은 head/tail 방식)"""
+    if isinstance(obj, pd.DataFrame):
+        obj = obj.to_dict(orient='records')
+    elif isinstance(obj, pd.Series):
+        obj = obj.to_dict()
+    if isinstance(obj, dict):
+        return {k: _shrink(v, max_items) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        if len(obj) > max_items:
+            head = max_items // 2
+            tail = max_items - head
+            omitted = len(obj) - max_items
+            obj = list(obj[:head]) + [f'... ({omitted}개 항목 생략) ...'] + list(obj[-tail:])
+        return [_shrink(v, max_items) for v in obj]
+    return obj
+
+
+def _dumps(obj):
+    try:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+    except TypeError:
+        # numpy 타입 키 등 orjson이 처리하지 못하는 구조는 기존 방식 사용
+        return str(obj)
+
+
+def _serialize(obj, max_chars=None):
+    """프롬프트 삽입용 JSON 직렬화 (str() 대비 토큰 수 감소, 한글 그대로 유지)
+    
+    결과가 max_chars(기본: Config.PROMPT_DATA_MAX_CHARS)를 넘으면 긴 리스트를
+    점점 짧게 축약해 프롬프트 크기를 예산 안으로 유지합니다.
+    레코드 리스트/DataFrame은 컬럼명을 한 번만 싣는 표 형태로 바꿔 직렬화합니다.
+    """
+    if max_chars is None:
+        max_chars = Config.PROMPT_DATA_MAX_CHARS
+    obj = _to_table(obj)
+    text = _dumps(obj)
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    
+    # 축약은 호출 측에서 데이터를 미리 집계하라는 신호이므로 경고로 남김
+    original_chars = len(text)
+    for max_items in (50, 20, 10, 4):
+        text = _dumps(_shrink(obj, max_items))
+        if len(text) <= max_chars:
+            logger.warning('⚠️ 프롬프트 데이터 축약: %d자 → %d자 (목록 최대 %d개)', original_chars, len(text), max_items)
+            return text
+    logger.warning('⚠️ 프롬프트 데이터 절단: %d자 → %d자', original_chars, max_chars)
+    return text[:max_chars] + ' ...(이하 생략)'
+
+
+# 리포트 공통 Markdown 포맷팅 규칙 (Bedrock system 블록으로 전달 → 프롬프트 캐시 대상)
+# 리포트별 제목 예시는 각 프롬프트에 둠 (공통 규칙에 특정 리포트 제목이 섞이지 않도록)
+_MD_RULES = """**Markdown 포맷팅 규칙 (반드시 준수):**
+1. H1 대제목 구분 규칙
+   - H1: "# 1. 섹션명"
+   - H1의 위와 아래에 구분선(---) 추가
+   - H1 아래에는 반드시 한 줄을 띄우고 내용 작성
+   - **중요**: H2, H3에는 구분선을 넣지 않습니다 (오직 H1만)
+
+2. 제목 넘버링 및 빈 줄 규칙
+   - H2: "## 1. 섹션명"
+   - H3: "### 1.1 소제목"
+   - **필수**: 제목 다음 줄은 반드시 빈 줄로 두세요
+   - 실제 제목은 요청 프롬프트의 제목 예시를 따르세요
+
+3. 들여쓰기 규칙
+   - H2 아래 → 글머리 기호 1단계 ("- ")
+   - H3 아래 → 글머리 기호 2단계 ("  - ")
+
+4. 표 작성 규칙
+   - GitHub-style Markdown table 사용
+   - 예시:
+     | 항목 | 값 |
+     |------|-----|
+     | A | 123 |
+   - 표 아래에는 한 줄 빈 줄 추가
+   - escape 문자 사용 금지 (\\|, \\- 금지)
+
+5. 순수 Markdown만 사용
+   - HTML, LaTeX, 코드블록 사용 금지"""
+
+_MD_RULES_BRIEF = """**Markdown 포맷팅 규칙:**
+- H2: "## 1. 섹션명" (제목 다음 줄은 빈 줄)
+- 글머리 기호: "- " 사용
+- 표: GitHub-style Markdown table
+- 순수 Markdown만 사용 (HTML, LaTeX 금지)"""
+
+
+def _md_heading_example(h1, h2, h2_body, h3, h3_bullet):
+    """리포트별 제목/구분선 예시 블록 (_MD_RULES 1, 2번 규칙의 올바른 예시)"""
+    return f"""**올바른 제목 예시 (Markdown 포맷팅 1, 2번 규칙):**
+```
+---
+
+# 1. {h1}
+
+## 1. {h2}
+
+{h2_body}
+
+### 1.1 {h3}
+
+- {h3_bullet}
+
+---
+```"""
+
+
+_EXECUTIVE_MD_EXAMPLE = _md_heading_example(
+    '경영진 요약', '전체 현황 요약', '현재 충전 인프라는...', '주요 지표', '총 충전소: 92,021개'
+)
+_CPO_MD_EXAMPLE = _md_heading_example(
+    'CPO 분석', '시장 점유율 분석', '현재 충전 인프라 시장은...', '상위 사업자', '한국전력공사: 충전소 15,234개'
+)
+_TREND_MD_EXAMPLE = _md_heading_example(
+    '트렌드 및 예측', '성장 추세 분석', '최근 6개월간 충전기는...', '월별 증감 추이', '2025-10: +597기 증가'
+)
+
+
+# GS차지비 관점 리포트 섹션 공통 프롬프트 (섹션별로 역할/기간/인사이트/작성 지침만 다름)
+# 세 섹션이 공유하는 데이터 블록은 섹션별 프롬프트 앞에 동일한 바이트로 두어 프롬프트 캐시 접두부가 되게 함
+_GS_DATA_TEMPLATE = """## GS차지비 현황
+{gs_info}
+
+## GS차지비 월별 추이
+{gs_trend}
+
+## 경쟁사 현황
+{competitor_info}
+"""
+
+_GS_PROMPT_TEMPLATE = """
+{role}
+
+{period}
+
+## {insights_title}
+{insights}
+
+---
+
+{directives}
+
+한국어로 작성해주세요.
+"""
+
+_GS_EXECUTIVE_DIRECTIVES = """**작성 지침:**
+1. GS차지비 관점에서 가장 중요한 인사이트 3가지를 먼저 제시
+2. 시장 내 GS차지비의 포지션 분석
+3. 주요 경쟁사 대비 강점/약점
+4. 즉각적인 주의가 필요한 사항"""
+
+_GS_COMPETITOR_DIRECTIVES = """**작성 지침:**
+1. GS차지비 vs 상위 경쟁사 비교 분석
+2. 시장점유율 변화 추이 분석
+3. 충전기 증설 속도 비교
+4. 경쟁사별 전략 추정 및 GS차지비 대응 방안
+5. 벤치마킹 대상 및 포인트
+
+**포함 내용:**
+- 경쟁사 대비 GS차지비의 강점/약점 표
+- 시장점유율 순위 변동 분석
+- 급속/완속 충전기 비율 비교
+- 성장률 비교"""
+
+_GS_STRATEGY_DIRECTIVES = """**작성 지침:**
+1. 단기 전략 (3개월 이내)
+   - 즉시 실행 가능한 액션 아이템
+   - 시장점유율 방어/확대 방안
+   
+2. 중기 전략 (6개월~1년)
+   - 충전기 증설 계획 제안
+   - 급속/완속 비율 최적화 방안
+   
+3. 장기 전략 (1년 이상)
+   - 시장 포지셔닝 전략
+   - 차별화 전략
+   
+4. 리스크 요인 및 대응 방안
+
+5. KPI 제안
+   - 모니터링해야 할 핵심 지표
+   - 목표 수치 제안"""
+
+
+# 리포트별 정적 규칙 (system 블록으로 전달되어 Bedrock 프롬프트 캐시 대상이 됨)
+_NO_CHART_RULES = """**금지 사항:**
+- 차트 제안 문장을 작성하지 마세요 (예: "📊 차트 제안:", "라인 차트로 시각화하면" 등)
+- 시각화 관련 제안을 하지 마세요"""
+
+# KPI Report 레이아웃 규칙
+_KPI_LAYOUT_RULES = f"""**레이아웃 규칙:**
+
+1) 제목 계층 (넘버링 포함):
+- H1: `# 1. Market-wide EV Infra KPIs`
+- H2: `## 1.1 National Infrastructure Overview`
+- H3: `### 1.1.1 Total Chargers`
+
+3) 섹션별 콜아웃 (H1 바로 아래):
+```
+> 💡 **Key Insight**
+> 
+> 이 섹션의 핵심 메시지를 2문장으로 요약합니다.
+```
+
+4) 숫자 표현:
+- 여러 수치는 표(Table) 형태로 정리
+- 예시:
+
+| Rank | CPO | Chargers | Share | MoM Change |
+|------|------------|----------|--------|------------|
+| 1 | GS차지비 | 73,290 | 16.2% | +120 |
+
+5) GS차지비 강조:
+- 표에서 GS차지비 행에 별도 코멘트
+- 별도 bullet에서 GS차지비만 따로 분석
+
+**할루시네이션 방지:**
+- 오직 "충전소 수, 완속/급속/총 충전기 수" 데이터에서 계산 가능한 사실만 사용
+- 전망/해석 시 반드시 관련 수치를 먼저 제시한 뒤 "이 수치를 기반으로 볼 때 ~로 해석될 수 있습니다."와 같이 추론임을 명시
+
+{_NO_CHART_RULES}
+
+**리포트 구조:**
+
+# 1. Market-wide EV Infra KPIs
+> 💡 콜아웃
+
+## 1.1 National Infrastructure Overview
+- 총 충전소 수
+- 총 충전기 수 (완속/급속 비율)
+- 전월 대비 증감
+
+## 1.2 Top CPO Market Share
+- 상위 5~10개 CPO 표
+- 상위 3/5사 집중도
+
+# 2. GS차지비 Position Summary
+> 💡 콜아웃
+
+## 2.1 Current Standing
+- 순위, 규모, 점유율
+- 전월 대비 변화
+
+## 2.2 Competitive Context
+- 상위 그룹 내 위치
+- 주요 경쟁사 대비 특징"""
+
+# CPO Ranking Report 레이아웃 규칙
+_CPO_RANKING_LAYOUT_RULES = f"""**레이아웃 규칙:**
+
+1) 제목 계층 (넘버링):
+- H1: `# 1. CPO Ranking Overview`
+- H2: `## 1.1 Top 15 CPO Leaderboard`
+- H3: `### 1.1.1 Charger Count Ranking`
+
+3) 섹션별 콜아웃 (H1 바로 아래):
+```
+> 💡 **Key Insight**
+> 
+> 핵심 메시지 2문장
+```
+
+4) 표 형식 (충전소당 평균 포함):
+
+| Rank | CPO | Chargers | Sites | Avg/Site | AC% | DC% | Share |
+|------|------------|----------|-------|----------|-----|-----|-------|
+| 1 | GS차지비 | 73,290 | 13,173| 5.56 | 85% | 15% | 16.2% |
+
+5) GS차지비 포지셔닝:
+- "Efficiency vs Coverage" 분석
+- 충전소당 평균 충전기 수로 효율성 평가
+- 완속/급속 비중으로 전략 특징 분석
+
+**할루시네이션 방지:**
+- 오직 충전소/충전기 수 데이터만 사용
+- 해석 시 반드시 수치 먼저 제시 후 추론임을 명시
+
+{_NO_CHART_RULES}
+
+**리포트 구조:**
+
+# 1. CPO Ranking Overview
+> 💡 콜아웃
+
+## 1.1 Top 15 CPO Leaderboard
+- 랭킹 표 (충전소당 평균 포함)
+
+## 1.2 Market Structure Analysis
+- 상위 3/5사 집중도
+- 롱테일 구조
+
+# 2. GS차지비 Detailed Positioning
+> 💡 콜아웃
+
+## 2.1 Ranking & Scale
+- 순위, 규모, 점유율
+
+## 2.2 Efficiency vs Coverage Analysis
+
+### 2.2.1 Operational Efficiency Matrix
+- 충전소당 평균 충전기 수 비교 (상위 10개사만 표로 작성)
+- **중요**: 표는 반드시 완전한 형태로 작성하세요. 모든 행과 열을 포함해야 합니다.
+- 표 예시:
+
+| Rank | CPO | Avg Chargers/Site |
+|------|-----|-------------------|
+| 1 | CPO명 | 5.56 |
+
+### 2.2.2 Strategic Positioning
+- 완속/급속 비중 특징
+- 주요 경쟁사 대비 포지션
+
+## 2.3 Strategic Implications
+- GS차지비의 구조적 특징
+- 경쟁 우위/약점"""
+
+# Monthly Trend Report 레이아웃 규칙
+_TREND_LAYOUT_RULES = f"""**레이아웃 규칙:**
+
+1) 제목 계층 (넘버링):
+- H1: `# 1. National Infrastructure Trend`
+- H2: `## 1.1 Monthly Charger Growth`
+- H3: `### 1.1.1 Total Chargers`
+
+3) 섹션별 콜아웃 (H1 바로 아래):
+```
+> 💡 **Key Insight**
+> 
+> 핵심 메시지 2문장
+```
+
+4) 월별 추이 표 형식:
+
+| Month | Total Chargers | AC | DC | MoM Change | Growth Rate |
+|-------|----------------|----|----|------------|-------------|
+| 2024-12 | 450,000 | 380,000 | 70,000 | +5,000 | +1.1% |
+
+5) GS차지비 트렌드 분석:
+- 월별 점유율 변화
+- 전국 대비 성장 속도 비교
+
+{_NO_CHART_RULES}
+
+**할루시네이션 방지:**
+- 오직 충전소/충전기 수 데이터만 사용
+- 전망 시 "~의 가능성이 있습니다" 같은 신중한 표현 사용
+- 해석 시 반드시 수치 먼저 제시
+
+**리포트 구조:**
+
+# 1. National Infrastructure Trend
+> 💡 콜아웃
+
+## 1.1 Monthly Charger Growth
+- 월별 총 충전기 추이 표
+- 완속/급속 변화 분석
+- 성장률 추이
+
+## 1.2 Structural Changes
+- 완속 vs 급속 비중 변화
+- 계절성 패턴 (관찰된 패턴만)
+
+# 2. GS차지비 Trend Analysis
+> 💡 콜아웃
+
+## 2.1 Monthly Performance
+### 2.1.1 GS차지비 Infrastructure Status
+
+**중요: 아래 표를 정확히 작성하세요. 모든 데이터는 제공된 "GS차지비 월별 추이" 데이터에서 가져와야 합니다.**
+
+| Month | Charging Stations | AC (완속) | DC (급속) | Total Chargers | Market Share | Rank |
+|-------|------------------|-----------|-----------|----------------|--------------|------|
+| 각 월별로 제공된 데이터에서 정확한 수치 입력 |
+
+**데이터 입력 규칙:**
+- Charging Stations: 충전소 수 (제공된 데이터의 "충전소 X개"에서 추출)
+- AC (완속): 완속충전기 수 (제공된 데이터의 "완속충전기 X기"에서 추출)  
+- DC (급속): 급속충전기 수 (제공된 데이터의 "급속충전기 X기"에서 추출)
+- Total Chargers: 총충전기 수 (제공된 데이터의 "총충전기 X기"에서 추출)
+- Market Share: 시장점유율 (제공된 데이터의 "점유율 X%"에서 추출)
+- Rank: 순위 (제공된 데이터의 "순위 X위"에서 추출)
+
+**⚠️⚠️⚠️ 중요: 데이터 표시 규칙 ⚠️⚠️⚠️**
+
+1. **절대 "-", "N/A", "데이터 없음"을 표에 사용하지 마세요**
+2. **제공된 실제 숫자 데이터만 사용하세요**
+3. **데이터가 0인 경우 "0"으로 표시하세요**
+4. **모든 숫자는 쉼표로 구분하세요 (예: 1,234)**
+
+**예시:**
+제공된 데이터에 "- 2025-11: 순위 2위, 충전소 1234개, 완속충전기 5678기, 급속충전기 2345기, 총충전기 8023기, 점유율 15.2%"가 있다면:
+| 2025-11 | 1,234 | 5,678 | 2,345 | 8,023 | 15.2% | 2 |
+
+**데이터 추출 실패 시에도 "0"으로 표시하고, 절대 "-"나 "N/A"를 사용하지 마세요.**
+
+- 점유율 변화 추이
+
+## 2.2 Growth Comparison
+- 전국 vs GS차지비 성장 속도
+- 상위 경쟁사 대비 성장률
+
+## 2.3 Outlook
+- 데이터 기반 단기 전망 (신중한 표현)"""
+
+# Strategy Report 작성 규칙/리포트 구성
+_STRATEGY_RULES = """**중요: 할루시네이션 방지 규칙**
+1. 절대로 제공되지 않은 지표(매출, 이용건수, kWh, 충전시간, 고객 수 등)를 언급하지 마세요
+2. "시장 구조", "성장성" 등 정성적 코멘트는 반드시 **충전소/충전기 수와 성장률, 비중**만을 근거로 해석하세요
+3. 데이터에 없는 내용은 "데이터 상 확인 불가" 또는 아예 언급하지 마세요
+4. 전략 제안은 데이터 기반의 합리적 추론만 하세요
+
+**리포트 구성:**
+
+## 1. GS차지비 Position Overview
+- 충전기 총량 & 충전소 수
+- 완속·급속 비율
+- 시장점유율(MS)
+- 업계 내 순위
+
+## 2. Benchmarking Against Competitors (경쟁사 벤치마킹)
+- 상위 5개사 비교 (표 형식)
+  - 충전기 수
+  - 성장률
+  - 급속 비중
+  - 충전소당 기기수
+- GS차지비 차별화 포지션
+
+## 3. Market Share Competitiveness
+- 점유율 추이
+- Top 3 대비 격차
+- 경쟁 압력 분석
+
+## 4. Strategic Risk & Opportunity Analysis
+**핵심 분석:**
+- 완속 중심 인프라의 구조조정 리스크
+- 급속 충전 시장 성장 대비 대응도
+- 경쟁사의 급속 확대 정책이 MS에 미치는 영향
+- 전국 완속 감소세와 GS차지비 전략 정합성
+
+## 5. Strategic Recommendation (전략 제안)
+**데이터 기반 전략:**
+- 급속 확대 vs 선택적 투자
+- 완속 운영 효율화
+- 경쟁사 대비 차별화 포인트 강화
+- 내부 KPI 제안 (예: 급속 비중, 설치/철거 기준 등)"""
+
+_STRATEGY_MD_RULES = """**Markdown 포맷팅 규칙:**
+- H2: "## 1. GS차지비 Position Overview" (제목 다음 줄은 빈 줄)
+- H3: "### 1.1 현재 포지션" (제목 다음 줄은 빈 줄)
+- 글머리 기호: "- " 사용
+- 표: GitHub-style Markdown table (| 항목 | 값 |)
+- 순수 Markdown만 사용 (HTML, LaTeX 금지)"""
+
+_STRATEGY_INSTRUCTIONS = f"{_STRATEGY_RULES}\n\n{_STRATEGY_MD_RULES}"
+
+
 class AIReportGenerator:
+    # 리포트 섹션별 Knowledge Base 검색 쿼리
+    KB_QUERIES = {
+        'executive_summary': '충전 인프라 현황 분석 트렌드',
+        'cpo_analysis': '충전사업자 CPO 분석',
+        'regional_analysis': '지역별 충전 인프라 분석',
+        'trend_forecast': '충전 인프라 성장 트렌드 예측',
+        'gs_executive_summary': 'GS차지비 충전 인프라 시장 분석',
+        'gs_competitor_analysis': '충전사업자 CPO 경쟁 분석',
+        'gs_strategy': '충전 인프라 성장 전략'
+    }
+    # 섹션 공통 쿼리 (Config.KB_SHARED_QUERY 사용 시 위 섹션별 쿼리 대신 사용)
+    KB_SHARED_QUERY = '충전 인프라 CPO 경쟁 트렌드 전략 GS차지비'
+    
     def __init__(self):
-        self.bedrock_client = boto3.client(
-            'bedrock-runtime',
-            region_name=Config.AWS_REGION,
-            aws_access_key_id=Config.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=Config.AWS_SECRET_ACCESS_KEY
-        )
-        self.kb_client = boto3.client(
-            'bedrock-agent-runtime',
-            region_name=Config.AWS_REGION,
-            aws_access_key_id=Config.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=Config.AWS_SECRET_ACCESS_KEY
-        )
+        # 리포트 단위 KB 컨텍스트 (쿼리 → 컨텍스트)
+        self._kb_context_cache = {}
+    
+    # 클라이언트는 처음 사용할 때 생성 (KB를 쓰지 않는 경로는 bedrock-agent-runtime 생성 비용을 내지 않음)
+    @cached_property
+    def bedrock_client(self):
+        return _get_client('bedrock-runtime')
+    
+    @cached_property
+    def kb_client(self):
+        return _get_client('bedrock-agent-runtime')
     
     def retrieve_from_kb(self, query):
         """Knowledge Base에서 관련 정보 검색"""
+        # KB가 비활성화된 설정이면 네트워크 호출/오류 로그 없이 빈 컨텍스트
+        if not Config.KNOWLEDGE_BASE_ID or Config.KB_NUMBER_OF_RESULTS <= 0:
+            return ''
+        if query in self._kb_context_cache:
+            return self._kb_context_cache[query]
+        
+        cache_key = _response_cache.make_key('kb', Config.KNOWLEDGE_BASE_ID, Config.KB_NUMBER_OF_RESULTS, query)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            self._kb_context_cache[query] = cached
+            return cached
+        
         try:
             response = self.kb_client.retrieve(
                 knowledgeBaseId=Config.KNOWLEDGE_BASE_ID,
@@ -36,64 +873,207 @@ class AIReportGenerator:
             
             results = response.get('retrievalResults', [])
             
-            if len(results) == 0:
-                return ''
-            
             context = '\n\n'.join([
                 f"[참고자료 {i+1}]\n{r.get('content', {}).get('text', '')}"
                 for i, r in enumerate(results)
             ])
             
+            _response_cache.set(cache_key, context)
+            self._kb_context_cache[query] = context
             return context
         
         except Exception as e:
-            print(f'❌ Knowledge Base 검색 오류: {e}', flush=True)
+            logger.exception('❌ Knowledge Base 검색 오류: %s', e)
             return ''
     
-    def invoke_bedrock(self, prompt, context=''):
-        """Bedrock 모델 호출 (리포트 생성용)"""
-        import time
+    def _kb_query(self, section_key):
+        """섹션별 KB 검색 쿼리
+        
+        섹션별 쿼리는 주제가 겹쳐 거의 같은 문서를 돌려주므로, 기본적으로 공통 쿼리 하나로
+        묶어 리포트당 KB 호출을 1회로 줄이고 섹션 간 컨텍스트(프롬프트 캐시 접두부)를 동일하게 유지합니다.
+        """
+        if Config.KB_SHARED_QUERY:
+            return self.KB_SHARED_QUERY
+        return self.KB_QUERIES[section_key]
+    
+    def _prefetch_kb_contexts(self, queries):
+        """리포트에 필요한 KB 컨텍스트를 미리 병렬 조회 (이후 retrieve_from_kb는 캐시 사용)"""
+        pending = [q for q in dict.fromkeys(queries) if q not in self._kb_context_cache]
+        if not pending:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            list(executor.map(self.retrieve_from_kb, pending))
+    
+    @staticmethod
+    def _section_chunk_handler(on_chunk, key):
+        """리포트 단위 콜백 on_chunk(섹션키, 텍스트)를 섹션별 스트리밍 콜백으로 변환"""
+        if on_chunk is None:
+            return None
+        return lambda text: on_chunk(key, text)
+    
+    @staticmethod
+    def clear_cache():
+        """Bedrock/KB 응답 캐시 비우기 (KB 문서 갱신 시 호출)"""
+        _response_cache.clear()
+    
+    @staticmethod
+    def _build_messages_payload(prompt, context, instructions, max_tokens, temperature, shared_data=''):
+        """Anthropic messages 페이로드 구성
+        
+        공통 규칙(instructions)은 system 블록, KB 컨텍스트와 섹션 공통 데이터(shared_data)는
+        사용자 메시지 앞부분에 두고 cache_control을 지정해 Bedrock 프롬프트 캐시가 정적 접두부를 재사용하도록 합니다.
+        """
+        payload = {
+            'anthropic_version': Config.ANTHROPIC_VERSION,
+            'max_tokens': max_tokens,
+            'temperature': temperature
+        }
+        
+        if not Config.PROMPT_CACHING:
+            # 캐싱을 끄면 system 블록 없이 하나의 사용자 메시지로 보냄
+            # (순서: context → shared_data → prompt → instructions, 캐시 사용 시 배치와 다름)
+            user_content = '\n\n'.join(part for part in (context, shared_data, prompt) if part)
+            if instructions:
+                user_content = f"{user_content}\n\n{instructions}"
+            payload['messages'] = [{'role': 'user', 'content': user_content}]
+            return payload
+        
+        cache_control = {'type': 'ephemeral'}
+        if instructions:
+            payload['system'] = [{'type': 'text', 'text': instructions, 'cache_control': cache_control}]
+        
+        content = []
+        if context:
+            content.append({'type': 'text', 'text': context, 'cache_control': cache_control})
+        if shared_data:
+            content.append({'type': 'text', 'text': shared_data, 'cache_control': cache_control})
+        content.append({'type': 'text', 'text': prompt})
+        payload['messages'] = [{'role': 'user', 'content': content}]
+        return payload
+    
+    def invoke_bedrock(self, prompt, context='', instructions='', on_chunk=None, max_tokens=None, shared_data=''):
+        """Bedrock 모델 호출 (리포트 생성용)
+        
+        instructions: 리포트 공통 규칙 (예: _MD_RULES) - system 블록으로 전달
+        on_chunk: 생성되는 텍스트 조각마다 호출할 콜백 (스트리밍 호출)
+        
+        콜백을 넘긴 경우에만 스트리밍으로 호출합니다. Config.BEDROCK_STREAMING(기본 false)을 켜면
+        콜백이 없어도 스트리밍으로 받습니다 (bedrock:InvokeModelWithResponseStream 권한 필요).
+        """
+        if on_chunk is not None or Config.BEDROCK_STREAMING:
+            return self.invoke_bedrock_stream(prompt, context, instructions, on_chunk, max_tokens, shared_data)
+        
+        max_tokens = max_tokens or Config.MAX_TOKENS
         try:
             start_time = time.time()
             
-            system_prompt = f"{context}\n\n{prompt}" if context else prompt
+            cache_key = _response_cache.make_key(
+                Config.MODEL_ID, Config.TEMPERATURE, max_tokens, instructions, context, shared_data, prompt
+            )
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                print('♻️ 캐시된 리포트 사용 (Bedrock 호출 생략)', flush=True)
+                return cached
             
-            payload = {
-                'anthropic_version': Config.ANTHROPIC_VERSION,
-                'max_tokens': Config.MAX_TOKENS,
-                'temperature': Config.TEMPERATURE,
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': system_prompt
-                    }
-                ]
-            }
+            payload = self._build_messages_payload(
+                prompt, context, instructions, max_tokens, Config.TEMPERATURE, shared_data
+            )
             
+            body = orjson.dumps(payload)
+            _bedrock_limiter.acquire(_estimate_tokens(body, payload['max_tokens']))
             response = self.bedrock_client.invoke_model(
                 modelId=Config.MODEL_ID,
                 contentType='application/json',
                 accept='application/json',
-                body=json.dumps(payload)
+                body=body
             )
             
-            response_body = json.loads(response['body'].read())
+            with closing(response['body']) as stream:
+                response_body = orjson.loads(stream.read())
             result = response_body['content'][0]['text']
             
             elapsed_time = time.time() - start_time
             print(f'✅ 리포트 생성 완료 (⏱️ {elapsed_time:.1f}초)', flush=True)
+            _response_cache.set(cache_key, result)
+            return result
+        
+        except Exception as e:
+            logger.exception('❌ Bedrock 호출 오류: %s', e)
+            return f"리포트 생성 중 오류가 발생했습니다: {str(e)}"
+    
+    def invoke_bedrock_stream(self, prompt, context='', instructions='', on_chunk=None, max_tokens=None, shared_data=''):
+        """Bedrock 스트리밍 호출 (첫 토큰부터 on_chunk로 전달, 전체 텍스트 반환)"""
+        max_tokens = max_tokens or Config.MAX_TOKENS
+        try:
+            start_time = time.time()
+            
+            cache_key = _response_cache.make_key(
+                Config.MODEL_ID, Config.TEMPERATURE, max_tokens, instructions, context, shared_data, prompt
+            )
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                print('♻️ 캐시된 리포트 사용 (Bedrock 호출 생략)', flush=True)
+                if on_chunk is not None:
+                    on_chunk(cached)
+                return cached
+            
+            payload = self._build_messages_payload(
+                prompt, context, instructions, max_tokens, Config.TEMPERATURE, shared_data
+            )
+            
+            body = orjson.dumps(payload)
+            _bedrock_limiter.acquire(_estimate_tokens(body, payload['max_tokens']))
+            response = self.bedrock_client.invoke_model_with_response_stream(
+                modelId=Config.MODEL_ID,
+                contentType='application/json',
+                accept='application/json',
+                body=body
+            )
+            
+            chunks = []
+            first_token_time = None
+            # 콜백 예외 등으로 중간에 빠져나와도 스트림(HTTP 연결)을 닫아 커넥션 풀에 반환
+            with closing(response['body']) as stream:
+                for event in stream:
+                    chunk = event.get('chunk')
+                    if not chunk:
+                        continue
+                    data = orjson.loads(chunk['bytes'])
+                    if data.get('type') != 'content_block_delta':
+                        continue
+                    text = data.get('delta', {}).get('text', '')
+                    if not text:
+                        continue
+                    if first_token_time is None:
+                        first_token_time = time.time() - start_time
+                        print(f'⚡ 첫 응답 수신 (⏱️ {first_token_time:.1f}초)', flush=True)
+                    chunks.append(text)
+                    if on_chunk is not None:
+                        on_chunk(text)
+            
+            result = ''.join(chunks)
+            elapsed_time = time.time() - start_time
+            print(f'✅ 리포트 생성 완료 (⏱️ {elapsed_time:.1f}초)', flush=True)
+            _response_cache.set(cache_key, result)
             return result
         
         except Exception as e:
-            print(f'❌ Bedrock 호출 오류: {e}', flush=True)
+            logger.exception('❌ Bedrock 호출 오류: %s', e)
             return f"리포트 생성 중 오류가 발생했습니다: {str(e)}"
     
     def invoke_bedrock_for_query(self, structured_prompt):
         """Bedrock 모델 호출 (커스텀 질의용 - 구조화된 프롬프트 사용)"""
-        import time
         try:
             start_time = time.time()
             
+            cache_key = _response_cache.make_key(Config.MODEL_ID, 0.3, Config.MAX_TOKENS, structured_prompt)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                elapsed_time = time.time() - start_time
+                print(f'♻️ 캐시된 응답 사용 (⏱️ {elapsed_time:.2f}초)', flush=True)
+                return cached, elapsed_time
+            
             payload = {
                 'anthropic_version': Config.ANTHROPIC_VERSION,
                 'max_tokens': Config.MAX_TOKENS,
@@ -106,29 +1086,33 @@ class AIReportGenerator:
                 ]
             }
             
+            body = orjson.dumps(payload)
+            _bedrock_limiter.acquire(_estimate_tokens(body, payload['max_tokens']))
             response = self.bedrock_client.invoke_model(
                 modelId=Config.MODEL_ID,
                 contentType='application/json',
                 accept='application/json',
-                body=json.dumps(payload)
+                body=body
             )
             
-            response_body = json.loads(response['body'].read())
+            with closing(response['body']) as stream:
+                response_body = orjson.loads(stream.read())
             result = response_body['content'][0]['text']
             
             elapsed_time = time.time() - start_time
             print(f'✅ Bedrock 응답 완료 (⏱️ {elapsed_time:.2f}초)', flush=True)
             
+            _response_cache.set(cache_key, result)
             return result, elapsed_time
         
         except Exception as e:
-            print(f'❌ Bedrock 호출 오류: {e}')
+            logger.exception('❌ Bedrock 호출 오류: %s', e)
             return None, 0
     
-    def generate_executive_summary(self, insights):
+    def generate_executive_summary(self, insights, on_chunk=None):
         """경영진 요약 리포트 생성"""
         # insights를 JSON 직렬화 가능한 형태로 변환
-        insights_str = str(insights)
+        insights_str = _serialize(insights)
         
         prompt = f"""
 다음은 한국 전기차 충전 인프라 현황 데이터 분석 결과입니다.
@@ -143,78 +1127,30 @@ class AIReportGenerator:
 - 데이터에 없는 내용은 "데이터 없음" 또는 "분석 불가"로 표시하세요
 - 구체적인 숫자를 언급할 때는 반드시 제공된 데이터에서 확인된 값만 사용하세요
 
-**작성 형식:**
-- 맨 처음에 핵심 요약 2문장을 작성해주세요 (가장 중요한 인사이트)
-- 그 다음 상세 내용을 작성해주세요
-
-**포함 내용 (제목에 넘버링 필수):**
-1. 전체 현황 요약 (3-4문장)
-2. 주요 발견사항 (Top 3-5)
-3. 시장 트렌드 분석
-4. 주요 사업자 현황
-5. 권장사항
-
-**Markdown 포맷팅 규칙 (반드시 준수):**
-1. H1 대제목 구분 규칙
-   - H1: "# 1. 섹션명"
-   - H1의 위와 아래에 구분선(---) 추가
-   - H1 아래에는 반드시 한 줄을 띄우고 내용 작성
-   - **중요**: H2, H3에는 구분선을 넣지 않습니다 (오직 H1만)
-   
-   올바른 H1 예시:
-   ```
-   ---
-   
-   # 1. 경영진 요약
-   
-   현재 충전 인프라는...
-   
-   ---
-   ```
-
-2. 제목 넘버링 및 빈 줄 규칙
-   - H2: "## 1. 전체 현황 요약"
-   - H3: "### 1.1 주요 지표"
-   - **필수**: 제목 다음 줄은 반드시 빈 줄로 두세요
-   
-   올바른 예시:
-   ```
-   ## 1. 전체 현황 요약
-   
-   현재 충전 인프라는...
-   
-   ### 1.1 주요 지표
-   
-   - 총 충전소: 92,021개
-   ```
-
-2. 들여쓰기 규칙
-   - H2 아래 → 글머리 기호 1단계 ("- ")
-   - H3 아래 → 글머리 기호 2단계 ("  - ")
+**작성 형식:**
+- 맨 처음에 핵심 요약 2문장을 작성해주세요 (가장 중요한 인사이트)
+- 그 다음 상세 내용을 작성해주세요
 
-3. 표 작성 규칙
-   - GitHub-style Markdown table 사용
-   - 예시:
-     | 항목 | 값 |
-     |------|-----|
-     | A | 123 |
-   - 표 아래에는 한 줄 빈 줄 추가
-   - escape 문자 사용 금지 (\\|, \\- 금지)
+**포함 내용 (제목에 넘버링 필수):**
+1. 전체 현황 요약 (3-4문장)
+2. 주요 발견사항 (Top 3-5)
+3. 시장 트렌드 분석
+4. 주요 사업자 현황
+5. 권장사항
 
-4. 순수 Markdown만 사용
-   - HTML, LaTeX, 코드블록 사용 금지
+{_EXECUTIVE_MD_EXAMPLE}
 
 한국어로 작성하고, 비즈니스 의사결정에 도움이 되도록 명확하고 간결하게 작성해주세요.
 """
         
         # Knowledge Base에서 추가 컨텍스트 검색
-        context = self.retrieve_from_kb('충전 인프라 현황 분석 트렌드')
+        context = self.retrieve_from_kb(self._kb_query('executive_summary'))
         
-        return self.invoke_bedrock(prompt, context)
+        return self.invoke_bedrock(prompt, context, instructions=_MD_RULES, on_chunk=on_chunk)
     
-    def generate_cpo_analysis(self, cpo_data):
+    def generate_cpo_analysis(self, cpo_data, on_chunk=None):
         """CPO별 상세 분석"""
-        cpo_str = str(cpo_data)
+        cpo_str = _serialize(cpo_data)
         
         prompt = f"""
 다음은 충전사업자(CPO)별 데이터입니다:
@@ -239,53 +1175,17 @@ class AIReportGenerator:
 3. 경쟁 구도 분석
 4. 성장 가능성 평가
 
-**Markdown 포맷팅 규칙 (반드시 준수):**
-1. H1 대제목 구분 규칙
-   - H1: "# 1. 섹션명"
-   - H1의 위와 아래에 구분선(---) 추가
-   - H1 아래에는 반드시 한 줄을 띄우고 내용 작성
-   - **중요**: H2, H3에는 구분선을 넣지 않습니다 (오직 H1만)
-   
-   올바른 H1 예시:
-   ```
-   ---
-   
-   # 1. CPO 분석
-   
-   충전사업자 시장은...
-   
-   ---
-   ```
-
-2. 제목 넘버링 및 빈 줄 규칙
-   - H2: "## 1. 시장 점유율 분석"
-   - H3: "### 1.1 상위 사업자"
-   - **필수**: 제목 다음 줄은 반드시 빈 줄로 두세요
-   
-   올바른 예시:
-   ```
-   ## 1. 시장 점유율 분석
-   
-   현재 충전 인프라 시장은...
-   
-   ### 1.1 상위 사업자
-   
-   - 한국전력공사: 충전소 15,234개
-   ```
-
-2. 들여쓰기: H2 아래는 "- ", H3 아래는 "  - "
-3. 표: GitHub-style Markdown table만 사용 (| 항목 | 값 |), escape 문자 금지
-4. 순수 Markdown만 사용 (HTML, LaTeX, 코드블록 금지)
+{_CPO_MD_EXAMPLE}
 
 한국어로 작성해주세요.
 """
         
-        context = self.retrieve_from_kb('충전사업자 CPO 분석')
-        return self.invoke_bedrock(prompt, context)
+        context = self.retrieve_from_kb(self._kb_query('cpo_analysis'))
+        return self.invoke_bedrock(prompt, context, instructions=_MD_RULES, on_chunk=on_chunk)
     
-    def generate_regional_analysis(self, region_data):
+    def generate_regional_analysis(self, region_data, on_chunk=None):
         """지역별 분석"""
-        region_str = str(region_data)
+        region_str = _serialize(region_data)
         
         prompt = f"""
 다음은 지역별 충전 인프라 데이터입니다:
@@ -302,12 +1202,12 @@ class AIReportGenerator:
 한국어로 작성해주세요.
 """
         
-        context = self.retrieve_from_kb('지역별 충전 인프라 분석')
-        return self.invoke_bedrock(prompt, context)
+        context = self.retrieve_from_kb(self._kb_query('regional_analysis'))
+        return self.invoke_bedrock(prompt, context, on_chunk=on_chunk)
     
-    def generate_trend_forecast(self, trend_data):
+    def generate_trend_forecast(self, trend_data, on_chunk=None):
         """트렌드 및 예측"""
-        trend_str = str(trend_data)
+        trend_str = _serialize(trend_data)
         
         prompt = f"""
 다음은 시계열 트렌드 데이터입니다:
@@ -333,52 +1233,19 @@ class AIReportGenerator:
 3. 향후 3-6개월 전망 (신중한 표현 사용)
 4. 주요 성장 동인 (데이터에서 확인 가능한 요인만)
 
-**Markdown 포맷팅 규칙 (반드시 준수):**
-1. H1 대제목 구분 규칙
-   - H1: "# 1. 섹션명"
-   - H1의 위와 아래에 구분선(---) 추가
-   - H1 아래에는 반드시 한 줄을 띄우고 내용 작성
-   - **중요**: H2, H3에는 구분선을 넣지 않습니다 (오직 H1만)
-   
-   올바른 H1 예시:
-   ```
-   ---
-   
-   # 1. 트렌드 및 예측
-   
-   최근 6개월간 충전기는...
-   
-   ---
-   ```
-
-2. 제목 넘버링 및 빈 줄 규칙
-   - H2: "## 1. 성장 추세 분석"
-   - H3: "### 1.1 월별 증감 추이"
-   - **필수**: 제목 다음 줄은 반드시 빈 줄로 두세요
-   
-   올바른 예시:
-   ```
-   ## 1. 성장 추세 분석
-   
-   최근 6개월간 충전기는...
-   
-   ### 1.1 월별 증감 추이
-   
-   - 2025-10: +597기 증가
-   ```
-
-2. 들여쓰기: H2 아래는 "- ", H3 아래는 "  - "
-3. 표: GitHub-style Markdown table만 사용 (| 항목 | 값 |), escape 문자 금지
-4. 순수 Markdown만 사용 (HTML, LaTeX, 코드블록 금지)
+{_TREND_MD_EXAMPLE}
 
 한국어로 작성해주세요.
 """
         
-        context = self.retrieve_from_kb('충전 인프라 성장 트렌드 예측')
-        return self.invoke_bedrock(prompt, context)
+        context = self.retrieve_from_kb(self._kb_query('trend_forecast'))
+        return self.invoke_bedrock(prompt, context, instructions=_MD_RULES, on_chunk=on_chunk)
     
-    def generate_full_report(self, insights):
-        """전체 종합 리포트 생성"""
+    def generate_full_report(self, insights, on_chunk=None):
+        """전체 종합 리포트 생성
+        
+        on_chunk: 지정하면 섹션별로 스트리밍 생성하며 on_chunk(섹션키, 텍스트)로 진행 상황 전달
+        """
         print('🤖 AI 분석 리포트 생성 중...\n')
         
         report = {
@@ -388,26 +1255,37 @@ class AIReportGenerator:
             'trend_forecast': None
         }
         
-        # 경영진 요약
-        print('📝 경영진 요약 생성 중...')
-        report['executive_summary'] = self.generate_executive_summary(insights)
+        # 섹션별 생성 작업 (서로 독립적이므로 병렬 실행)
+        sections = {'executive_summary': (self.generate_executive_summary, insights)}
         
         # CPO 분석
         if insights.get('cpo_analysis') is not None:
-            print('📝 CPO 분석 생성 중...')
-            report['cpo_analysis'] = self.generate_cpo_analysis(insights['cpo_analysis'])
+            sections['cpo_analysis'] = (self.generate_cpo_analysis, insights['cpo_analysis'])
         
         # 트렌드 예측
         if insights.get('trend') is not None:
-            print('📝 트렌드 예측 생성 중...')
-            report['trend_forecast'] = self.generate_trend_forecast(insights['trend'])
+            sections['trend_forecast'] = (self.generate_trend_forecast, insights['trend'])
+        
+        # 섹션별 KB 컨텍스트를 한 번에 병렬 조회 (공통 쿼리 사용 시 1회)
+        self._prefetch_kb_contexts([self._kb_query(key) for key in sections])
+        
+        print(f'📝 {len(sections)}개 섹션 병렬 생성 중...')
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = {
+                key: executor.submit(fn, arg, on_chunk=self._section_chunk_handler(on_chunk, key))
+                for key, (fn, arg) in sections.items()
+            }
+            for key, future in futures.items():
+                report[key] = future.result()
         
         print('✅ AI 리포트 생성 완료\n')
         return report
     
-    def generate_gs_chargebee_report(self, target_month, target_insights, range_insights, target_data, range_data, available_months):
-        """GS차지비 관점 AI 리포트 생성"""
-        import time
+    def generate_gs_chargebee_report(self, target_month, target_insights, range_insights, target_data, range_data, available_months, on_chunk=None):
+        """GS차지비 관점 AI 리포트 생성
+        
+        on_chunk: 지정하면 섹션별로 스트리밍 생성하며 on_chunk(섹션키, 텍스트)로 진행 상황 전달
+        """
         print(f'🤖 GS차지비 관점 AI 리포트 생성 중... (기준월: {target_month})\n')
         
         report = {
@@ -417,23 +1295,25 @@ class AIReportGenerator:
             'response_times': {}
         }
         
-        # GS차지비 데이터 추출
-        gs_target = target_data[target_data['CPO명'] == 'GS차지비'] if 'CPO명' in target_data.columns else None
-        gs_range = range_data[range_data['CPO명'] == 'GS차지비'] if 'CPO명' in range_data.columns else None
+        # GS차지비 현황이 없으면 세 섹션 모두 근거 없는 내용이 되므로 Bedrock 호출 생략
+        issue = _gs_data_issue(target_data, target_month)
+        if issue:
+            print(f'⚠️ GS차지비 리포트 생략: {issue}', flush=True)
+            message = _insufficient_data_report(issue)
+            for key in ('executive_summary', 'cpo_analysis', 'trend_forecast'):
+                report[key] = message
+                if on_chunk is not None:
+                    on_chunk(key, message)
+            return report
+        
+        # GS차지비 월별 데이터 추출
+        gs_monthly = _gs_monthly(range_data)
         
         # GS차지비 정보 문자열 생성
         gs_info = ""
-        if gs_target is not None and len(gs_target) > 0:
-            gs_row = gs_target.iloc[0]
-            gs_info = f"""
-GS차지비 {target_month} 현황:
-- 순위: {gs_row.get('순위', 'N/A')}위
-- 충전소 수: {gs_row.get('충전소수', 'N/A')}개
-- 완속충전기: {gs_row.get('완속충전기', 'N/A')}기
-- 급속충전기: {gs_row.get('급속충전기', 'N/A')}기
-- 총충전기: {gs_row.get('총충전기', 'N/A')}기
-- 시장점유율: {gs_row.get('시장점유율', 'N/A')}
-- 순위변동: {gs_row.get('순위변동', 'N/A')}
+        gs_row = _gs_row(target_data)
+        if gs_row is not None:
+            gs_info = _gs_status_block(gs_row, target_month) + f"""- 순위변동: {gs_row.get('순위변동', 'N/A')}
 - 충전소증감: {gs_row.get('충전소증감', 'N/A')}
 - 완속증감: {gs_row.get('완속증감', 'N/A')}
 - 급속증감: {gs_row.get('급속증감', 'N/A')}
@@ -442,195 +1322,146 @@ GS차지비 {target_month} 현황:
         
         # GS차지비 월별 추이
         gs_trend = ""
-        if gs_range is not None and len(gs_range) > 0:
-            gs_trend = "\nGS차지비 월별 추이:\n"
-            for _, row in gs_range.sort_values('snapshot_month').iterrows():
-                gs_trend += f"- {row.get('snapshot_month', 'N/A')}: 순위 {row.get('순위', 'N/A')}위, 총충전기 {row.get('총충전기', 'N/A')}기, 시장점유율 {row.get('시장점유율', 'N/A')}\n"
+        if gs_monthly is not None and len(gs_monthly) > 0:
+            gs_trend = "\nGS차지비 월별 추이:\n" + ''.join(
+                f"- {month}: 순위 {rank}위, 총충전기 {total}기, 시장점유율 {share}\n"
+                for month, rank, total, share in zip(
+                    _column(gs_monthly, 'snapshot_month', 'N/A').tolist(),
+                    _column(gs_monthly, '순위', 'N/A').tolist(),
+                    _column(gs_monthly, '총충전기', 'N/A').tolist(),
+                    _column(gs_monthly, '시장점유율', 'N/A').tolist()
+                )
+            )
         
         # 경쟁사 분석 (상위 10개사)
         competitor_info = ""
         if 'CPO명' in target_data.columns:
-            top10 = target_data.nlargest(10, '총충전기') if '총충전기' in target_data.columns else target_data.head(10)
-            competitor_info = f"\n{target_month} 상위 10개 CPO:\n"
-            for _, row in top10.iterrows():
-                cpo_name = row.get('CPO명', 'N/A')
-                rank = row.get('순위', 'N/A')
-                stations = row.get('충전소수')
-                total_chargers = row.get('총충전기')
-                market_share = row.get('시장점유율')
-                total_change = row.get('총증감')
-                
-                # NaN 처리
-                stations = int(stations) if pd.notna(stations) else 'N/A'
-                total_chargers = int(total_chargers) if pd.notna(total_chargers) else 'N/A'
-                market_share = f"{market_share:.1f}%" if pd.notna(market_share) else 'N/A'
-                total_change = f"{int(total_change):+d}" if pd.notna(total_change) else 'N/A'
-                
-                competitor_info += f"- {cpo_name}: 순위 {rank}위, 충전소 {stations}개, 총충전기 {total_chargers}기, 시장점유율 {market_share}, 총증감 {total_change}기\n"
-        
-        # 1. 경영진 요약 (GS차지비 관점)
-        print('📝 [1/3] 경영진 요약 생성 중...', flush=True)
-        start_time = time.time()
-        report['executive_summary'] = self._generate_gs_executive_summary(
-            target_month, gs_info, gs_trend, competitor_info, target_insights, available_months
-        )
-        report['response_times']['executive_summary'] = round(time.time() - start_time, 1)
+            top10 = _top_by_chargers(target_data, 10) if '총충전기' in target_data.columns else target_data.head(10)
+            # NaN은 'N/A'로 표시 (벡터 연산으로 한 번에 포맷팅)
+            stations = pd.to_numeric(_column(top10, '충전소수'), errors='coerce')
+            total_chargers = pd.to_numeric(_column(top10, '총충전기'), errors='coerce')
+            market_share = pd.to_numeric(_column(top10, '시장점유율'), errors='coerce')
+            total_change = pd.to_numeric(_column(top10, '총증감'), errors='coerce')
+            
+            stations_str = stations.fillna(0).astype('int64').astype(str).where(stations.notna(), 'N/A')
+            total_chargers_str = total_chargers.fillna(0).astype('int64').astype(str).where(total_chargers.notna(), 'N/A')
+            market_share_str = market_share.map('{:.1f}%'.format).where(market_share.notna(), 'N/A')
+            total_change_str = total_change.fillna(0).astype('int64').map('{:+d}'.format).where(total_change.notna(), 'N/A')
+            
+            competitor_info = f"\n{target_month} 상위 10개 CPO:\n" + ''.join(
+                f"- {cpo_name}: 순위 {rank}위, 충전소 {st}개, 총충전기 {tc}기, 시장점유율 {ms}, 총증감 {chg}기\n"
+                for cpo_name, rank, st, tc, ms, chg in zip(
+                    _column(top10, 'CPO명', 'N/A').tolist(),
+                    _column(top10, '순위', 'N/A').tolist(),
+                    stations_str.tolist(),
+                    total_chargers_str.tolist(),
+                    market_share_str.tolist(),
+                    total_change_str.tolist()
+                )
+            )
         
-        # 2. 경쟁 분석 (GS차지비 관점)
-        print('📝 [2/3] 경쟁 분석 생성 중...', flush=True)
-        start_time = time.time()
-        report['cpo_analysis'] = self._generate_gs_competitor_analysis(
-            target_month, gs_info, gs_trend, competitor_info, target_insights, range_insights
-        )
-        report['response_times']['cpo_analysis'] = round(time.time() - start_time, 1)
+        # 세 섹션 공통 데이터 블록 (한 번만 만들어 동일한 캐시 접두부로 공유)
+        gs_block = _GS_DATA_TEMPLATE.format(gs_info=gs_info, gs_trend=gs_trend, competitor_info=competitor_info)
         
-        # 3. 전략 제안 (GS차지비 관점)
-        print('📝 [3/3] 전략 제안 생성 중...', flush=True)
-        start_time = time.time()
-        report['trend_forecast'] = self._generate_gs_strategy(
-            target_month, gs_info, gs_trend, competitor_info, range_insights, available_months
-        )
-        report['response_times']['trend_forecast'] = round(time.time() - start_time, 1)
+        # 3개 섹션은 서로 독립적이므로 병렬 실행 (Bedrock 응답 대기 시간이 겹치도록)
+        def run_section(key, fn, *args):
+            start_time = time.time()
+            result = fn(*args, on_chunk=self._section_chunk_handler(on_chunk, key))
+            return result, round(time.time() - start_time, 1)
+        
+        sections = {
+            # 1. 경영진 요약 (GS차지비 관점)
+            'executive_summary': (
+                self._generate_gs_executive_summary,
+                (target_month, gs_block, target_insights, available_months)
+            ),
+            # 2. 경쟁 분석 (GS차지비 관점)
+            'cpo_analysis': (
+                self._generate_gs_competitor_analysis,
+                (target_month, gs_block, target_insights, range_insights)
+            ),
+            # 3. 전략 제안 (GS차지비 관점)
+            'trend_forecast': (
+                self._generate_gs_strategy,
+                (target_month, gs_block, range_insights, available_months)
+            )
+        }
+        
+        print('📝 경영진 요약 / 경쟁 분석 / 전략 제안 병렬 생성 중...', flush=True)
+        total_start = time.time()
+        
+        # 세 섹션의 KB 컨텍스트를 한 번에 병렬 조회 (공통 쿼리 사용 시 1회)
+        self._prefetch_kb_contexts([
+            self._kb_query('gs_executive_summary'),
+            self._kb_query('gs_competitor_analysis'),
+            self._kb_query('gs_strategy')
+        ])
+
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = {key: executor.submit(run_section, key, fn, *args) for key, (fn, args) in sections.items()}
+            for key, future in futures.items():
+                report[key], report['response_times'][key] = future.result()
         
-        total_time = sum(report['response_times'].values())
+        total_time = time.time() - total_start
         print(f'✅ GS차지비 AI 리포트 생성 완료 (총 ⏱️ {total_time:.1f}초)\n', flush=True)
         return report
     
-    def _generate_gs_executive_summary(self, target_month, gs_info, gs_trend, competitor_info, insights, available_months):
+    def _generate_gs_section(self, kb_key, role, period, gs_block, insights_title, insights, directives, on_chunk=None, max_tokens=None):
+        """GS차지비 리포트 섹션 공통 생성 (_GS_PROMPT_TEMPLATE에 섹션별 값만 채움)
+        
+        gs_block: _GS_DATA_TEMPLATE으로 만든 세 섹션 공통 데이터 (섹션 프롬프트 앞에 캐시 대상으로 전달)
+        """
+        prompt = _GS_PROMPT_TEMPLATE.format(
+            role=role,
+            period=period,
+            insights_title=insights_title,
+            insights=_serialize(insights),
+            directives=directives
+        )
+        context = self.retrieve_from_kb(self._kb_query(kb_key))
+        return self.invoke_bedrock(
+            prompt, context, instructions=_MD_RULES_BRIEF, on_chunk=on_chunk, max_tokens=max_tokens, shared_data=gs_block
+        )
+    
+    def _generate_gs_executive_summary(self, target_month, gs_block, insights, available_months, on_chunk=None):
         """GS차지비 경영진 요약"""
-        prompt = f"""
-당신은 GS차지비의 전략 컨설턴트입니다. 다음 데이터를 바탕으로 GS차지비 경영진을 위한 핵심 요약 리포트를 작성해주세요.
-
-## 기준월: {target_month}
-## 분석 가능 기간: {available_months[0]} ~ {available_months[-1]} ({len(available_months)}개월)
-
-## GS차지비 현황
-{gs_info}
-
-## GS차지비 월별 추이
-{gs_trend}
-
-## 경쟁사 현황
-{competitor_info}
-
-## 전체 시장 인사이트
-{str(insights)}
-
----
-
-**작성 지침:**
-1. GS차지비 관점에서 가장 중요한 인사이트 3가지를 먼저 제시
-2. 시장 내 GS차지비의 포지션 분석
-3. 주요 경쟁사 대비 강점/약점
-4. 즉각적인 주의가 필요한 사항
-
-**Markdown 포맷팅 규칙:**
-- H2: "## 1. 섹션명" (제목 다음 줄은 빈 줄)
-- 글머리 기호: "- " 사용
-- 표: GitHub-style Markdown table
-- 순수 Markdown만 사용 (HTML, LaTeX 금지)
-
-한국어로 작성해주세요.
-"""
-        context = self.retrieve_from_kb('GS차지비 충전 인프라 시장 분석')
-        return self.invoke_bedrock(prompt, context)
+        return self._generate_gs_section(
+            'gs_executive_summary',
+            '당신은 GS차지비의 전략 컨설턴트입니다. 위 데이터를 바탕으로 GS차지비 경영진을 위한 핵심 요약 리포트를 작성해주세요.',
+            f"## 기준월: {target_month}\n## 분석 가능 기간: {available_months[0]} ~ {available_months[-1]} ({len(available_months)}개월)",
+            gs_block,
+            '전체 시장 인사이트',
+            insights,
+            _GS_EXECUTIVE_DIRECTIVES,
+            on_chunk=on_chunk,
+            max_tokens=Config.SUMMARY_MAX_TOKENS
+        )
     
-    def _generate_gs_competitor_analysis(self, target_month, gs_info, gs_trend, competitor_info, target_insights, range_insights):
+    def _generate_gs_competitor_analysis(self, target_month, gs_block, target_insights, range_insights, on_chunk=None):
         """GS차지비 경쟁 분석"""
-        prompt = f"""
-당신은 GS차지비의 경쟁 분석 전문가입니다. 다음 데이터를 바탕으로 GS차지비의 경쟁 환경을 분석해주세요.
-
-## 기준월: {target_month}
-
-## GS차지비 현황
-{gs_info}
-
-## GS차지비 월별 추이
-{gs_trend}
-
-## 경쟁사 현황
-{competitor_info}
-
-## 시장 인사이트
-{str(target_insights)}
-
----
-
-**작성 지침:**
-1. GS차지비 vs 상위 경쟁사 비교 분석
-2. 시장점유율 변화 추이 분석
-3. 충전기 증설 속도 비교
-4. 경쟁사별 전략 추정 및 GS차지비 대응 방안
-5. 벤치마킹 대상 및 포인트
-
-**포함 내용:**
-- 경쟁사 대비 GS차지비의 강점/약점 표
-- 시장점유율 순위 변동 분석
-- 급속/완속 충전기 비율 비교
-- 성장률 비교
-
-**Markdown 포맷팅 규칙:**
-- H2: "## 1. 섹션명" (제목 다음 줄은 빈 줄)
-- 글머리 기호: "- " 사용
-- 표: GitHub-style Markdown table
-- 순수 Markdown만 사용 (HTML, LaTeX 금지)
-
-한국어로 작성해주세요.
-"""
-        context = self.retrieve_from_kb('충전사업자 CPO 경쟁 분석')
-        return self.invoke_bedrock(prompt, context)
+        return self._generate_gs_section(
+            'gs_competitor_analysis',
+            '당신은 GS차지비의 경쟁 분석 전문가입니다. 위 데이터를 바탕으로 GS차지비의 경쟁 환경을 분석해주세요.',
+            f"## 기준월: {target_month}",
+            gs_block,
+            '시장 인사이트',
+            target_insights,
+            _GS_COMPETITOR_DIRECTIVES,
+            on_chunk=on_chunk
+        )
     
-    def _generate_gs_strategy(self, target_month, gs_info, gs_trend, competitor_info, range_insights, available_months):
+    def _generate_gs_strategy(self, target_month, gs_block, range_insights, available_months, on_chunk=None):
         """GS차지비 전략 제안"""
-        prompt = f"""
-당신은 GS차지비의 전략 기획 전문가입니다. 다음 데이터를 바탕으로 GS차지비의 성장 전략을 제안해주세요.
-
-## 기준월: {target_month}
-## 분석 기간: {available_months[0]} ~ {available_months[-1]}
-
-## GS차지비 현황
-{gs_info}
-
-## GS차지비 월별 추이
-{gs_trend}
-
-## 경쟁사 현황
-{competitor_info}
-
-## 시장 트렌드
-{str(range_insights.get('trend', {}))}
-
----
-
-**작성 지침:**
-1. 단기 전략 (3개월 이내)
-   - 즉시 실행 가능한 액션 아이템
-   - 시장점유율 방어/확대 방안
-   
-2. 중기 전략 (6개월~1년)
-   - 충전기 증설 계획 제안
-   - 급속/완속 비율 최적화 방안
-   
-3. 장기 전략 (1년 이상)
-   - 시장 포지셔닝 전략
-   - 차별화 전략
-   
-4. 리스크 요인 및 대응 방안
-
-5. KPI 제안
-   - 모니터링해야 할 핵심 지표
-   - 목표 수치 제안
-
-**Markdown 포맷팅 규칙:**
-- H2: "## 1. 섹션명" (제목 다음 줄은 빈 줄)
-- 글머리 기호: "- " 사용
-- 표: GitHub-style Markdown table
-- 순수 Markdown만 사용 (HTML, LaTeX 금지)
-
-한국어로 작성해주세요.
-"""
-        context = self.retrieve_from_kb('충전 인프라 성장 전략')
-        return self.invoke_bedrock(prompt, context)
+        return self._generate_gs_section(
+            'gs_strategy',
+            '당신은 GS차지비의 전략 기획 전문가입니다. 위 데이터를 바탕으로 GS차지비의 성장 전략을 제안해주세요.',
+            f"## 기준월: {target_month}\n## 분석 기간: {available_months[0]} ~ {available_months[-1]}",
+            gs_block,
+            '시장 트렌드',
+            range_insights.get('trend', {}),
+            _GS_STRATEGY_DIRECTIVES,
+            on_chunk=on_chunk
+        )
 
     
     def generate_kpi_snapshot_report(self, target_month, target_insights, target_data, available_months):
@@ -638,74 +1469,40 @@ GS차지비 {target_month} 현황:
         print(f'📊 KPI Report 생성 중... (기준월: {target_month})', flush=True)
         
         # GS차지비 데이터 추출
-        gs_data = target_data[target_data['CPO명'] == 'GS차지비'] if 'CPO명' in target_data.columns else None
         gs_info = ""
-        if gs_data is not None and len(gs_data) > 0:
-            gs_row = gs_data.iloc[0]
-            gs_info = f"""
-GS차지비 {target_month} 현황:
-- 순위: {gs_row.get('순위', 'N/A')}위
-- 충전소 수: {gs_row.get('충전소수', 'N/A')}개
-- 완속충전기: {gs_row.get('완속충전기', 'N/A')}기
-- 급속충전기: {gs_row.get('급속충전기', 'N/A')}기
-- 총충전기: {gs_row.get('총충전기', 'N/A')}기
-- 시장점유율: {gs_row.get('시장점유율', 'N/A')}
-- 전월 대비 증감: 충전소 {gs_row.get('충전소증감', 'N/A')}, 완속 {gs_row.get('완속증감', 'N/A')}, 급속 {gs_row.get('급속증감', 'N/A')}, 총 {gs_row.get('총증감', 'N/A')}
+        gs_row = _gs_row(target_data)
+        if gs_row is not None:
+            gs_info = _gs_status_block(gs_row, target_month) + f"""- 전월 대비 증감: 충전소 {gs_row.get('충전소증감', 'N/A')}, 완속 {gs_row.get('완속증감', 'N/A')}, 급속 {gs_row.get('급속증감', 'N/A')}, 총 {gs_row.get('총증감', 'N/A')}
 """
         
         # 상위 10개 CPO 정보
         top10_info = ""
         if 'CPO명' in target_data.columns and '총충전기' in target_data.columns:
-            top10 = target_data.nlargest(10, '총충전기')
-            top10_info = f"\n{target_month} 상위 10개 CPO:\n"
-            
+            top10 = _top_by_chargers(target_data, 10)
             # 간단한 상태 확인
             print(f'🔍 상위 10개 CPO 데이터: {len(top10)}개 준비완료')
             
-            for idx, row in top10.iterrows():
-                # 안전한 데이터 추출
-                rank = row.get('순위', 'N/A')
-                cpo_name = row.get('CPO명', 'N/A')
-                stations = row.get('충전소수')
-                total_chargers = row.get('총충전기')
-                slow_chargers = row.get('완속충전기')
-                fast_chargers = row.get('급속충전기')
-                market_share = row.get('시장점유율')
-                total_change = row.get('총증감')
-                
-                # 강화된 NaN 처리 - 절대 'N/A'나 '-'를 반환하지 않음
-                def safe_convert_int(val):
-                    try:
-                        if pd.isna(val) or val is None:
-                            return 0
-                        if isinstance(val, str) and (val.strip() == '' or val.strip() == '-'):
-                            return 0
-                        return int(float(val))
-                    except (ValueError, TypeError):
-                        return 0
-                
-                def safe_convert_float(val):
-                    try:
-                        if pd.isna(val) or val is None:
-                            return 0.0
-                        if isinstance(val, str) and (val.strip() == '' or val.strip() == '-'):
-                            return 0.0
-                        return float(val)
-                    except (ValueError, TypeError):
-                        return 0.0
-                
-                stations = safe_convert_int(stations)
-                total_chargers = safe_convert_int(total_chargers)
-                slow_chargers = safe_convert_int(slow_chargers)
-                fast_chargers = safe_convert_int(fast_chargers)
-                market_share_val = safe_convert_float(market_share)
-                total_change_val = safe_convert_int(total_change)
-                
-                # 포맷팅
-                market_share_str = f"{market_share_val:.1f}%"
-                total_change_str = f"{total_change_val:+d}" if total_change_val != 0 else "0"
-                
-                top10_info += f"- {rank}위. {cpo_name}: 충전소 {stations:,}개, 총충전기 {total_chargers:,}기 (완속 {slow_chargers:,}, 급속 {fast_chargers:,}), 점유율 {market_share_str}, 전월 대비 {total_change_str}기\n"
+            # 강화된 NaN 처리 - 절대 'N/A'나 '-'를 반환하지 않음 (컬럼 단위로 한 번에 변환)
+            stations = _to_int(_column(top10, '충전소수'))
+            total_chargers = _to_int(_column(top10, '총충전기'))
+            slow_chargers = _to_int(_column(top10, '완속충전기'))
+            fast_chargers = _to_int(_column(top10, '급속충전기'))
+            market_share = _to_float(_column(top10, '시장점유율'))
+            total_change = _to_int(_column(top10, '총증감'))
+            
+            top10_info = f"\n{target_month} 상위 10개 CPO:\n" + ''.join(
+                f"- {rank}위. {cpo_name}: 충전소 {st:,}개, 총충전기 {tc:,}기 (완속 {slow:,}, 급속 {fast:,}), 점유율 {ms:.1f}%, 전월 대비 {f'{chg:+d}' if chg != 0 else '0'}기\n"
+                for rank, cpo_name, st, tc, slow, fast, ms, chg in zip(
+                    _column(top10, '순위', 'N/A').tolist(),
+                    _column(top10, 'CPO명', 'N/A').tolist(),
+                    stations.tolist(),
+                    total_chargers.tolist(),
+                    slow_chargers.tolist(),
+                    fast_chargers.tolist(),
+                    market_share.tolist(),
+                    total_change.tolist()
+                )
+            )
         
         # 전체 시장 요약
         summary = target_insights.get('summary', {})
@@ -754,107 +1551,48 @@ GS차지비 {target_month} 현황:
 ## GS차지비 현황
 {gs_info}
 
-## 상위 10개 CPO
-{top10_info}
-
----
-
-**리포트 유형: EV Infra KPI Snapshot Report**
-
-이 리포트는 한 기준월({target_month})을 기준으로 전국 EV 충전 인프라의 "단면(KPI 스냅샷)"을 정리하는 리포트입니다.
-
-**중요: 기준월은 {target_month}입니다. 리포트 내용에서 날짜를 언급할 때는 반드시 {target_month}를 사용하세요.**
-
-**주요 내용:**
-- 국가 전체 총 충전소 수, 완속/급속/총 충전기 수 (KPI)
-- 전월 대비 증감 수치
-- 상위 5~10개 CPO의 충전기/충전소 규모 비교 표
-- 상위 CPO 집중도(Top N 비중) 요약
-- GS차지비의 순위, 규모, 전체 대비 비중 요약
-
-**날짜 표기 규칙:**
-- 기준월을 언급할 때는 반드시 "{target_month}"를 사용하세요.
-- 다른 날짜(예: 2024-10)를 임의로 만들지 마세요.
-- 위에 제공된 데이터의 날짜만 사용하세요.
-
-**중요: 리포트는 반드시 아래 HTML 타이틀로 정확히 시작해야 합니다:**
-
-<div align="center">
-<h1>📊 EV Infra KPI Report</h1>
-<p style="color: #666; font-size: 14px;">분석 기간: {report_start_month} ~ {report_end_month} ({report_period_count}개월) | 기준월: {report_target_month}</p>
-</div>
-
-**⚠️ 위 HTML을 그대로 복사하세요. 날짜를 절대 변경하지 마세요:**
-- {report_start_month} (분석 시작)
-- {report_end_month} (분석 종료)  
-- {report_target_month} (기준월)
-
-이 날짜들만 사용하고, 다른 날짜(예: 2024-10)를 절대 만들지 마세요.
-
-**레이아웃 규칙:**
-
-1) 제목 계층 (넘버링 포함):
-- H1: `# 1. Market-wide EV Infra KPIs`
-- H2: `## 1.1 National Infrastructure Overview`
-- H3: `### 1.1.1 Total Chargers`
-
-3) 섹션별 콜아웃 (H1 바로 아래):
-```
-> 💡 **Key Insight**
-> 
-> 이 섹션의 핵심 메시지를 2문장으로 요약합니다.
-```
-
-4) 숫자 표현:
-- 여러 수치는 표(Table) 형태로 정리
-- 예시:
-
-| Rank | CPO | Chargers | Share | MoM Change |
-|------|------------|----------|--------|------------|
-| 1 | GS차지비 | 73,290 | 16.2% | +120 |
-
-5) GS차지비 강조:
-- 표에서 GS차지비 행에 별도 코멘트
-- 별도 bullet에서 GS차지비만 따로 분석
+## 상위 10개 CPO
+{top10_info}
 
-**할루시네이션 방지:**
-- 오직 "충전소 수, 완속/급속/총 충전기 수" 데이터에서 계산 가능한 사실만 사용
-- 전망/해석 시 반드시 관련 수치를 먼저 제시한 뒤 "이 수치를 기반으로 볼 때 ~로 해석될 수 있습니다."와 같이 추론임을 명시
+---
 
-**금지 사항:**
-- 차트 제안 문장을 작성하지 마세요 (예: "📊 차트 제안:", "라인 차트로 시각화하면" 등)
-- 시각화 관련 제안을 하지 마세요
+**리포트 유형: EV Infra KPI Snapshot Report**
 
-**리포트 구조:**
+이 리포트는 한 기준월({target_month})을 기준으로 전국 EV 충전 인프라의 "단면(KPI 스냅샷)"을 정리하는 리포트입니다.
 
-# 1. Market-wide EV Infra KPIs
-> 💡 콜아웃
+**중요: 기준월은 {target_month}입니다. 리포트 내용에서 날짜를 언급할 때는 반드시 {target_month}를 사용하세요.**
 
-## 1.1 National Infrastructure Overview
-- 총 충전소 수
-- 총 충전기 수 (완속/급속 비율)
-- 전월 대비 증감
+**주요 내용:**
+- 국가 전체 총 충전소 수, 완속/급속/총 충전기 수 (KPI)
+- 전월 대비 증감 수치
+- 상위 5~10개 CPO의 충전기/충전소 규모 비교 표
+- 상위 CPO 집중도(Top N 비중) 요약
+- GS차지비의 순위, 규모, 전체 대비 비중 요약
 
-## 1.2 Top CPO Market Share
-- 상위 5~10개 CPO 표
-- 상위 3/5사 집중도
+**날짜 표기 규칙:**
+- 기준월을 언급할 때는 반드시 "{target_month}"를 사용하세요.
+- 다른 날짜(예: 2024-10)를 임의로 만들지 마세요.
+- 위에 제공된 데이터의 날짜만 사용하세요.
 
-# 2. GS차지비 Position Summary
-> 💡 콜아웃
+**중요: 리포트는 반드시 아래 HTML 타이틀로 정확히 시작해야 합니다:**
 
-## 2.1 Current Standing
-- 순위, 규모, 점유율
-- 전월 대비 변화
+<div align="center">
+<h1>📊 EV Infra KPI Report</h1>
+<p style="color: #666; font-size: 14px;">분석 기간: {report_start_month} ~ {report_end_month} ({report_period_count}개월) | 기준월: {report_target_month}</p>
+</div>
 
-## 2.2 Competitive Context
-- 상위 그룹 내 위치
-- 주요 경쟁사 대비 특징
+**⚠️ 위 HTML을 그대로 복사하세요. 날짜를 절대 변경하지 마세요:**
+- {report_start_month} (분석 시작)
+- {report_end_month} (분석 종료)  
+- {report_target_month} (기준월)
+
+이 날짜들만 사용하고, 다른 날짜(예: 2024-10)를 절대 만들지 마세요.
 
-한국어로 작성하되, HTML 타이틀과 표는 위 형식을 정확히 따라주세요.
+한국어로 작성하되, HTML 타이틀과 표는 지정된 형식을 정확히 따라주세요.
 """
         
         context = self.retrieve_from_kb('충전 인프라 KPI 현황 분석')
-        return self.invoke_bedrock(prompt, context)
+        return self.invoke_bedrock(prompt, context, instructions=_KPI_LAYOUT_RULES)
     
     def generate_cpo_ranking_report(self, target_month, target_insights, target_data, available_months):
         """CPO Ranking & GS차지비 Positioning Report 생성"""
@@ -867,10 +1605,9 @@ GS차지비 {target_month} 현황:
         report_period_count = len(available_months)
         
         # GS차지비 데이터 추출
-        gs_data = target_data[target_data['CPO명'] == 'GS차지비'] if 'CPO명' in target_data.columns else None
         gs_info = ""
-        if gs_data is not None and len(gs_data) > 0:
-            gs_row = gs_data.iloc[0]
+        gs_row = _gs_row(target_data)
+        if gs_row is not None:
             total = int(gs_row.get('총충전기', 0))
             stations = int(gs_row.get('충전소수', 0))
             avg_per_site = total / stations if stations > 0 else 0
@@ -892,19 +1629,28 @@ GS차지비 {target_month} 상세:
         # 상위 15개 CPO 상세 정보 (충전소당 평균 포함)
         top15_detail = ""
         if 'CPO명' in target_data.columns and '총충전기' in target_data.columns:
-            top15 = target_data.nlargest(15, '총충전기')
-            top15_detail = f"\n상위 15개 CPO 상세 ({target_month}):\n"
-            for _, row in top15.iterrows():
-                cpo_name = row.get('CPO명', 'N/A')
-                total = int(row.get('총충전기', 0))
-                stations = int(row.get('충전소수', 0))
-                slow = int(row.get('완속충전기', 0))
-                fast = int(row.get('급속충전기', 0))
-                avg_per_site = total / stations if stations > 0 else 0
-                slow_pct = (slow / total * 100) if total > 0 else 0
-                fast_pct = (fast / total * 100) if total > 0 else 0
-                
-                top15_detail += f"- {row.get('순위', 'N/A')}위. {cpo_name}: 총 {total:,}기, 충전소 {stations:,}개, 충전소당 {avg_per_site:.2f}기, 완속 {slow:,}기({slow_pct:.1f}%), 급속 {fast:,}기({fast_pct:.1f}%), 점유율 {row.get('시장점유율', 'N/A')}, 증감 {row.get('총증감', 'N/A')}기\n"
+            top15 = _top_by_chargers(target_data, 15)
+            totals = _to_int(_column(top15, '총충전기'))
+            stations = _to_int(_column(top15, '충전소수'))
+            slows = _to_int(_column(top15, '완속충전기'))
+            fasts = _to_int(_column(top15, '급속충전기'))
+            
+            top15_detail = f"\n상위 15개 CPO 상세 ({target_month}):\n" + ''.join(
+                f"- {rank}위. {cpo_name}: 총 {total:,}기, 충전소 {st:,}개, 충전소당 {avg_per_site:.2f}기, 완속 {slow:,}기({slow_pct:.1f}%), 급속 {fast:,}기({fast_pct:.1f}%), 점유율 {share}, 증감 {change}기\n"
+                for rank, cpo_name, total, st, avg_per_site, slow, slow_pct, fast, fast_pct, share, change in zip(
+                    _column(top15, '순위', 'N/A').tolist(),
+                    _column(top15, 'CPO명', 'N/A').tolist(),
+                    totals.tolist(),
+                    stations.tolist(),
+                    _ratio(totals, stations).tolist(),
+                    slows.tolist(),
+                    _ratio(slows, totals, 100).tolist(),
+                    fasts.tolist(),
+                    _ratio(fasts, totals, 100).tolist(),
+                    _column(top15, '시장점유율', 'N/A').tolist(),
+                    _column(top15, '총증감', 'N/A').tolist()
+                )
+            )
         
         # 시장 구조
         summary = target_insights.get('summary', {})
@@ -986,81 +1732,11 @@ GS차지비 {target_month} 상세:
 
 이 날짜들만 사용하고, 다른 날짜(예: 2024-10)를 절대 만들지 마세요.
 
-**레이아웃 규칙:**
-
-1) 제목 계층 (넘버링):
-- H1: `# 1. CPO Ranking Overview`
-- H2: `## 1.1 Top 15 CPO Leaderboard`
-- H3: `### 1.1.1 Charger Count Ranking`
-
-3) 섹션별 콜아웃 (H1 바로 아래):
-```
-> 💡 **Key Insight**
-> 
-> 핵심 메시지 2문장
-```
-
-4) 표 형식 (충전소당 평균 포함):
-
-| Rank | CPO | Chargers | Sites | Avg/Site | AC% | DC% | Share |
-|------|------------|----------|-------|----------|-----|-----|-------|
-| 1 | GS차지비 | 73,290 | 13,173| 5.56 | 85% | 15% | 16.2% |
-
-5) GS차지비 포지셔닝:
-- "Efficiency vs Coverage" 분석
-- 충전소당 평균 충전기 수로 효율성 평가
-- 완속/급속 비중으로 전략 특징 분석
-
-**할루시네이션 방지:**
-- 오직 충전소/충전기 수 데이터만 사용
-- 해석 시 반드시 수치 먼저 제시 후 추론임을 명시
-
-**금지 사항:**
-- 차트 제안 문장을 작성하지 마세요 (예: "📊 차트 제안:", "라인 차트로 시각화하면" 등)
-- 시각화 관련 제안을 하지 마세요
-
-**리포트 구조:**
-
-# 1. CPO Ranking Overview
-> 💡 콜아웃
-
-## 1.1 Top 15 CPO Leaderboard
-- 랭킹 표 (충전소당 평균 포함)
-
-## 1.2 Market Structure Analysis
-- 상위 3/5사 집중도
-- 롱테일 구조
-
-# 2. GS차지비 Detailed Positioning
-> 💡 콜아웃
-
-## 2.1 Ranking & Scale
-- 순위, 규모, 점유율
-
-## 2.2 Efficiency vs Coverage Analysis
-
-### 2.2.1 Operational Efficiency Matrix
-- 충전소당 평균 충전기 수 비교 (상위 10개사만 표로 작성)
-- **중요**: 표는 반드시 완전한 형태로 작성하세요. 모든 행과 열을 포함해야 합니다.
-- 표 예시:
-
-| Rank | CPO | Avg Chargers/Site |
-|------|-----|-------------------|
-| 1 | CPO명 | 5.56 |
-
-### 2.2.2 Strategic Positioning
-- 완속/급속 비중 특징
-- 주요 경쟁사 대비 포지션
-
-## 2.3 Strategic Implications
-- GS차지비의 구조적 특징
-- 경쟁 우위/약점
-
-한국어로 작성하되, HTML 타이틀과 표는 위 형식을 정확히 따라주세요.
+한국어로 작성하되, HTML 타이틀과 표는 지정된 형식을 정확히 따라주세요.
 """
         
         context = self.retrieve_from_kb('CPO 순위 경쟁 분석')
-        return self.invoke_bedrock(prompt, context)
+        return self.invoke_bedrock(prompt, context, instructions=_CPO_RANKING_LAYOUT_RULES)
     
     def generate_monthly_trend_report(self, target_month, range_insights, range_data, available_months):
         """Monthly Trend Report 생성 - 시계열 분석 중심"""
@@ -1075,65 +1751,39 @@ GS차지비 {target_month} 상세:
         # 월별 추이 데이터 추출
         monthly_trend = ""
         if 'snapshot_month' in range_data.columns:
-            monthly_summary = range_data.groupby('snapshot_month').agg({
-                '충전소수': 'sum',
-                '완속충전기': 'sum',
-                '급속충전기': 'sum',
-                '총충전기': 'sum'
-            }).reset_index()
+            monthly_summary = _monthly_totals(range_data)
             
-            monthly_trend = "\n월별 충전 인프라 추이:\n"
-            for _, row in monthly_summary.iterrows():
-                monthly_trend += f"- {row['snapshot_month']}: 충전소 {row['충전소수']}개, 완속 {row['완속충전기']}기, 급속 {row['급속충전기']}기, 총 {row['총충전기']}기\n"
+            monthly_trend = "\n월별 충전 인프라 추이:\n" + ''.join(
+                f"- {month}: 충전소 {st}개, 완속 {slow}기, 급속 {fast}기, 총 {total}기\n"
+                for month, st, slow, fast, total in zip(
+                    monthly_summary.index.tolist(),
+                    monthly_summary['충전소수'].tolist(),
+                    monthly_summary['완속충전기'].tolist(),
+                    monthly_summary['급속충전기'].tolist(),
+                    monthly_summary['총충전기'].tolist()
+                )
+            )
         
         # GS차지비 월별 추이
         gs_trend = ""
-        if 'CPO명' in range_data.columns:
-            gs_monthly = range_data[range_data['CPO명'] == 'GS차지비'].sort_values('snapshot_month')
+        gs_monthly = _gs_monthly(range_data)
+        if gs_monthly is not None:
             print(f'🔍 GS차지비 월별 데이터: {len(gs_monthly)}개월 준비완료')
             
             if len(gs_monthly) > 0:
-                gs_trend = "\nGS차지비 월별 추이:\n"
-                for _, row in gs_monthly.iterrows():
-                    # 안전한 데이터 추출
-                    month = row.get('snapshot_month', 'N/A')
-                    rank = row.get('순위', 'N/A')
-                    stations = row.get('충전소수')
-                    slow_chargers = row.get('완속충전기')
-                    fast_chargers = row.get('급속충전기')
-                    total_chargers = row.get('총충전기')
-                    market_share = row.get('시장점유율')
-                    
-                    # 강화된 데이터 변환 함수
-                    def safe_convert_int(val):
-                        try:
-                            if pd.isna(val) or val is None:
-                                return 0
-                            if isinstance(val, str) and (val.strip() == '' or val.strip() == '-' or val.strip().lower() == 'n/a'):
-                                return 0
-                            return int(float(val))
-                        except (ValueError, TypeError):
-                            return 0
-                    
-                    def safe_convert_float(val):
-                        try:
-                            if pd.isna(val) or val is None:
-                                return 0.0
-                            if isinstance(val, str) and (val.strip() == '' or val.strip() == '-' or val.strip().lower() == 'n/a'):
-                                return 0.0
-                            return float(val)
-                        except (ValueError, TypeError):
-                            return 0.0
-                    
-                    # 안전한 변환 적용
-                    stations = safe_convert_int(stations)
-                    slow_chargers = safe_convert_int(slow_chargers)
-                    fast_chargers = safe_convert_int(fast_chargers)
-                    total_chargers = safe_convert_int(total_chargers)
-                    market_share_val = safe_convert_float(market_share)
-                    market_share = f"{market_share_val:.1f}%"
-                    
-                    gs_trend += f"- {month}: 순위 {rank}위, 충전소 {stations}개, 완속충전기 {slow_chargers}기, 급속충전기 {fast_chargers}기, 총충전기 {total_chargers}기, 점유율 {market_share}\n"
+                # 강화된 데이터 변환 - 컬럼 단위로 한 번에 처리
+                gs_trend = "\nGS차지비 월별 추이:\n" + ''.join(
+                    f"- {month}: 순위 {rank}위, 충전소 {st}개, 완속충전기 {slow}기, 급속충전기 {fast}기, 총충전기 {total}기, 점유율 {share:.1f}%\n"
+                    for month, rank, st, slow, fast, total, share in zip(
+                        _column(gs_monthly, 'snapshot_month', 'N/A').tolist(),
+                        _column(gs_monthly, '순위', 'N/A').tolist(),
+                        _to_int(_column(gs_monthly, '충전소수')).tolist(),
+                        _to_int(_column(gs_monthly, '완속충전기')).tolist(),
+                        _to_int(_column(gs_monthly, '급속충전기')).tolist(),
+                        _to_int(_column(gs_monthly, '총충전기')).tolist(),
+                        _to_float(_column(gs_monthly, '시장점유율')).tolist()
+                    )
+                )
             else:
                 print('⚠️ GS차지비 데이터를 찾을 수 없습니다!')
                 # CPO명 목록 확인
@@ -1146,17 +1796,23 @@ GS차지비 {target_month} 상세:
         if 'CPO명' in range_data.columns and '총충전기' in range_data.columns:
             # 최신 월 기준 상위 10개 CPO 선정
             latest_month = available_months[-1] if available_months else target_month
-            latest_data = range_data[range_data['snapshot_month'] == latest_month]
+            latest_data = _month_rows(range_data, latest_month)
             top10_cpos = latest_data.nlargest(10, '총충전기')['CPO명'].tolist()
             
-            top10_trend = "\n상위 10개 CPO 월별 추이:\n"
+            # 상위 10개 CPO 행만 한 번 정렬한 뒤 CPO별 첫 달/마지막 달을 groupby로 추출
+            subset = range_data[range_data['CPO명'].isin(top10_cpos)].sort_values('snapshot_month', kind='stable')
+            grouped = subset.groupby('CPO명', sort=False, observed=True)
+            first_rows = grouped.head(1).set_index('CPO명', drop=False)
+            last_rows = grouped.tail(1).set_index('CPO명', drop=False)
+            
+            lines = []
             for cpo in top10_cpos:
-                cpo_data = range_data[range_data['CPO명'] == cpo].sort_values('snapshot_month')
-                if len(cpo_data) > 0:
-                    first_month = cpo_data.iloc[0]
-                    last_month = cpo_data.iloc[-1]
+                if cpo in first_rows.index:
+                    first_month = first_rows.loc[cpo].to_dict()
+                    last_month = last_rows.loc[cpo].to_dict()
                     growth = int(last_month.get('총충전기', 0)) - int(first_month.get('총충전기', 0))
-                    top10_trend += f"- {cpo}: {first_month.get('snapshot_month', 'N/A')} {first_month.get('총충전기', 'N/A')}기 → {last_month.get('snapshot_month', 'N/A')} {last_month.get('총충전기', 'N/A')}기 (증감: {growth:+d}기)\n"
+                    lines.append(f"- {cpo}: {first_month.get('snapshot_month', 'N/A')} {first_month.get('총충전기', 'N/A')}기 → {last_month.get('snapshot_month', 'N/A')} {last_month.get('총충전기', 'N/A')}기 (증감: {growth:+d}기)\n")
+            top10_trend = "\n상위 10개 CPO 월별 추이:\n" + ''.join(lines)
         
         prompt = f"""
 <role>
@@ -1226,110 +1882,25 @@ GS차지비 {target_month} 상세:
 
 이 날짜들만 사용하고, 다른 날짜(예: 2024-10)를 절대 만들지 마세요.
 
-**레이아웃 규칙:**
-
-1) 제목 계층 (넘버링):
-- H1: `# 1. National Infrastructure Trend`
-- H2: `## 1.1 Monthly Charger Growth`
-- H3: `### 1.1.1 Total Chargers`
-
-3) 섹션별 콜아웃 (H1 바로 아래):
-```
-> 💡 **Key Insight**
-> 
-> 핵심 메시지 2문장
-```
-
-4) 월별 추이 표 형식:
-
-| Month | Total Chargers | AC | DC | MoM Change | Growth Rate |
-|-------|----------------|----|----|------------|-------------|
-| 2024-12 | 450,000 | 380,000 | 70,000 | +5,000 | +1.1% |
-
-5) GS차지비 트렌드 분석:
-- 월별 점유율 변화
-- 전국 대비 성장 속도 비교
-
-**금지 사항:**
-- 차트 제안 문장을 작성하지 마세요 (예: "📊 차트 제안:", "라인 차트로 시각화하면" 등)
-- 시각화 관련 제안을 하지 마세요
-
-**할루시네이션 방지:**
-- 오직 충전소/충전기 수 데이터만 사용
-- 전망 시 "~의 가능성이 있습니다" 같은 신중한 표현 사용
-- 해석 시 반드시 수치 먼저 제시
-
-**리포트 구조:**
-
-# 1. National Infrastructure Trend
-> 💡 콜아웃
-
-## 1.1 Monthly Charger Growth
-- 월별 총 충전기 추이 표
-- 완속/급속 변화 분석
-- 성장률 추이
-
-## 1.2 Structural Changes
-- 완속 vs 급속 비중 변화
-- 계절성 패턴 (관찰된 패턴만)
-
-# 2. GS차지비 Trend Analysis
-> 💡 콜아웃
-
-## 2.1 Monthly Performance
-### 2.1.1 GS차지비 Infrastructure Status
-
-**중요: 아래 표를 정확히 작성하세요. 모든 데이터는 위에 제공된 "GS차지비 월별 추이" 데이터에서 가져와야 합니다.**
-
-| Month | Charging Stations | AC (완속) | DC (급속) | Total Chargers | Market Share | Rank |
-|-------|------------------|-----------|-----------|----------------|--------------|------|
-| 각 월별로 위 데이터에서 정확한 수치 입력 |
-
-**데이터 입력 규칙:**
-- Charging Stations: 충전소 수 (위 데이터의 "충전소 X개"에서 추출)
-- AC (완속): 완속충전기 수 (위 데이터의 "완속충전기 X기"에서 추출)  
-- DC (급속): 급속충전기 수 (위 데이터의 "급속충전기 X기"에서 추출)
-- Total Chargers: 총충전기 수 (위 데이터의 "총충전기 X기"에서 추출)
-- Market Share: 시장점유율 (위 데이터의 "점유율 X%"에서 추출)
-- Rank: 순위 (위 데이터의 "순위 X위"에서 추출)
-
-**⚠️⚠️⚠️ 중요: 데이터 표시 규칙 ⚠️⚠️⚠️**
-
-1. **절대 "-", "N/A", "데이터 없음"을 표에 사용하지 마세요**
-2. **위에 제공된 실제 숫자 데이터만 사용하세요**
-3. **데이터가 0인 경우 "0"으로 표시하세요**
-4. **모든 숫자는 쉼표로 구분하세요 (예: 1,234)**
-
-**예시:**
-위 데이터에 "- 2025-11: 순위 2위, 충전소 1234개, 완속충전기 5678기, 급속충전기 2345기, 총충전기 8023기, 점유율 15.2%"가 있다면:
-| 2025-11 | 1,234 | 5,678 | 2,345 | 8,023 | 15.2% | 2 |
-
-**데이터 추출 실패 시에도 "0"으로 표시하고, 절대 "-"나 "N/A"를 사용하지 마세요.**
-
-- 점유율 변화 추이
-
-## 2.2 Growth Comparison
-- 전국 vs GS차지비 성장 속도
-- 상위 경쟁사 대비 성장률
-
-## 2.3 Outlook
-- 데이터 기반 단기 전망 (신중한 표현)
-
-한국어로 작성하되, HTML 타이틀과 표는 위 형식을 정확히 따라주세요.
+한국어로 작성하되, HTML 타이틀과 표는 지정된 형식을 정확히 따라주세요.
 """
         
         context = self.retrieve_from_kb('충전 인프라 트렌드 시계열 분석')
-        return self.invoke_bedrock(prompt, context)
+        return self.invoke_bedrock(prompt, context, instructions=_TREND_LAYOUT_RULES)
     
     def generate_strategy_report(self, target_month, target_insights, range_insights, target_data, range_data, available_months):
         """Strategy Report 생성 - 경쟁력·전략 분석 중심"""
         print(f'🎯 Strategy Report 생성 중... (기준월: {target_month})', flush=True)
         
+        issue = _gs_data_issue(target_data, target_month)
+        if issue:
+            print(f'⚠️ Strategy Report 생략: {issue}', flush=True)
+            return _insufficient_data_report(issue)
+        
         # GS차지비 데이터 추출
-        gs_target = target_data[target_data['CPO명'] == 'GS차지비'] if 'CPO명' in target_data.columns else None
         gs_info = ""
-        if gs_target is not None and len(gs_target) > 0:
-            gs_row = gs_target.iloc[0]
+        gs_row = _gs_row(target_data)
+        if gs_row is not None:
             slow_ratio = (int(gs_row.get('완속충전기', 0)) / int(gs_row.get('총충전기', 1)) * 100) if gs_row.get('총충전기', 0) > 0 else 0
             fast_ratio = (int(gs_row.get('급속충전기', 0)) / int(gs_row.get('총충전기', 1)) * 100) if gs_row.get('총충전기', 0) > 0 else 0
             
@@ -1347,26 +1918,42 @@ GS차지비 {target_month} 포지션:
         # 경쟁사 벤치마킹 (상위 5개사)
         competitor_benchmark = ""
         if 'CPO명' in target_data.columns and '총충전기' in target_data.columns:
-            top5 = target_data.nlargest(5, '총충전기')
-            competitor_benchmark = f"\n상위 5개사 벤치마킹 ({target_month}):\n"
-            for _, row in top5.iterrows():
-                cpo_name = row.get('CPO명', 'N/A')
-                total = int(row.get('총충전기', 0))
-                slow = int(row.get('완속충전기', 0))
-                fast = int(row.get('급속충전기', 0))
-                slow_pct = (slow / total * 100) if total > 0 else 0
-                fast_pct = (fast / total * 100) if total > 0 else 0
-                
-                competitor_benchmark += f"- {row.get('순위', 'N/A')}위. {cpo_name}: 총 {total}기 (완속 {slow}기 {slow_pct:.1f}%, 급속 {fast}기 {fast_pct:.1f}%), 점유율 {row.get('시장점유율', 'N/A')}, 증감 {row.get('총증감', 'N/A')}기\n"
+            top5 = _top_by_chargers(target_data, 5)
+            totals = _to_int(_column(top5, '총충전기'))
+            slows = _to_int(_column(top5, '완속충전기'))
+            fasts = _to_int(_column(top5, '급속충전기'))
+            
+            competitor_benchmark = f"\n상위 5개사 벤치마킹 ({target_month}):\n" + ''.join(
+                f"- {rank}위. {cpo_name}: 총 {total}기 (완속 {slow}기 {slow_pct:.1f}%, 급속 {fast}기 {fast_pct:.1f}%), 점유율 {share}, 증감 {change}기\n"
+                for rank, cpo_name, total, slow, slow_pct, fast, fast_pct, share, change in zip(
+                    _column(top5, '순위', 'N/A').tolist(),
+                    _column(top5, 'CPO명', 'N/A').tolist(),
+                    totals.tolist(),
+                    slows.tolist(),
+                    _ratio(slows, totals, 100).tolist(),
+                    fasts.tolist(),
+                    _ratio(fasts, totals, 100).tolist(),
+                    _column(top5, '시장점유율', 'N/A').tolist(),
+                    _column(top5, '총증감', 'N/A').tolist()
+                )
+            )
         
         # GS차지비 월별 추이
         gs_trend = ""
         if 'CPO명' in range_data.columns:
-            gs_monthly = range_data[range_data['CPO명'] == 'GS차지비'].sort_values('snapshot_month')
+            gs_monthly = _gs_monthly(range_data)
             if len(gs_monthly) > 0:
-                gs_trend = "\nGS차지비 월별 추이:\n"
-                for _, row in gs_monthly.iterrows():
-                    gs_trend += f"- {row.get('snapshot_month', 'N/A')}: 순위 {row.get('순위', 'N/A')}위, 총충전기 {row.get('총충전기', 'N/A')}기, 점유율 {row.get('시장점유율', 'N/A')}, 증감 {row.get('총증감', 'N/A')}기\n"
+                columns = zip(
+                    _column(gs_monthly, 'snapshot_month', 'N/A').tolist(),
+                    _column(gs_monthly, '순위', 'N/A').tolist(),
+                    _column(gs_monthly, '총충전기', 'N/A').tolist(),
+                    _column(gs_monthly, '시장점유율', 'N/A').tolist(),
+                    _column(gs_monthly, '총증감', 'N/A').tolist()
+                )
+                gs_trend = "\nGS차지비 월별 추이:\n" + ''.join(
+                    f"- {month}: 순위 {rank}위, 총충전기 {total}기, 점유율 {share}, 증감 {change}기\n"
+                    for month, rank, total, share, change in columns
+                )
         
         # 시장 구조 분석
         market_structure = ""
@@ -1399,65 +1986,14 @@ GS차지비 {target_month} 포지션:
 ## 시장 구조
 {market_structure}
 
----
-
-**중요: 할루시네이션 방지 규칙**
-1. 절대로 제공되지 않은 지표(매출, 이용건수, kWh, 충전시간, 고객 수 등)를 언급하지 마세요
-2. "시장 구조", "성장성" 등 정성적 코멘트는 반드시 **충전소/충전기 수와 성장률, 비중**만을 근거로 해석하세요
-3. 데이터에 없는 내용은 "데이터 상 확인 불가" 또는 아예 언급하지 마세요
-4. 전략 제안은 데이터 기반의 합리적 추론만 하세요
-
-**리포트 구성:**
-
-## 1. GS차지비 Position Overview
-- 충전기 총량 & 충전소 수
-- 완속·급속 비율
-- 시장점유율(MS)
-- 업계 내 순위
-
-## 2. Benchmarking Against Competitors (경쟁사 벤치마킹)
-- 상위 5개사 비교 (표 형식)
-  - 충전기 수
-  - 성장률
-  - 급속 비중
-  - 충전소당 기기수
-- GS차지비 차별화 포지션
-
-## 3. Market Share Competitiveness
-- 점유율 추이
-- Top 3 대비 격차
-- 경쟁 압력 분석
-
-## 4. Strategic Risk & Opportunity Analysis
-**핵심 분석:**
-- 완속 중심 인프라의 구조조정 리스크
-- 급속 충전 시장 성장 대비 대응도
-- 경쟁사의 급속 확대 정책이 MS에 미치는 영향
-- 전국 완속 감소세와 GS차지비 전략 정합성
-
-## 5. Strategic Recommendation (전략 제안)
-**데이터 기반 전략:**
-- 급속 확대 vs 선택적 투자
-- 완속 운영 효율화
-- 경쟁사 대비 차별화 포인트 강화
-- 내부 KPI 제안 (예: 급속 비중, 설치/철거 기준 등)
-
-**Markdown 포맷팅 규칙:**
-- H2: "## 1. GS차지비 Position Overview" (제목 다음 줄은 빈 줄)
-- H3: "### 1.1 현재 포지션" (제목 다음 줄은 빈 줄)
-- 글머리 기호: "- " 사용
-- 표: GitHub-style Markdown table (| 항목 | 값 |)
-- 순수 Markdown만 사용 (HTML, LaTeX 금지)
-
 한국어로 작성해주세요.
 """
         
         context = self.retrieve_from_kb('GS차지비 경쟁력 전략 분석')
-        return self.invoke_bedrock(prompt, context)
+        return self.invoke_bedrock(prompt, context, instructions=_STRATEGY_INSTRUCTIONS)
 
     def generate_ai_simulation(self, base_month, simulation_months, additional_chargers, full_data, target_data):
         """AI 기반 시장점유율 시뮬레이션 예측 - RAG 데이터 기반"""
-        import time
         print(f'\n🎯 AI 시뮬레이션 예측 시작 (RAG 기반)', flush=True)
         print(f'   ├─ 기준월: {base_month}', flush=True)
         print(f'   ├─ 예측 기간: {simulation_months}개월', flush=True)
@@ -1476,74 +2012,96 @@ GS차지비 {target_month} 포지션:
             f'충전인프라 시장 성장률 경쟁사 분석'
         ]
         
-        rag_context_parts = []
-        for query in rag_queries:
-            ctx = self.retrieve_from_kb(query)
-            if ctx:
-                rag_context_parts.append(ctx)
+        # 네 쿼리를 병렬 조회 (이후 retrieve_from_kb는 캐시 사용)
+        self._prefetch_kb_contexts(rag_queries)
+        rag_context_parts = [ctx for ctx in map(self.retrieve_from_kb, rag_queries) if ctx]
         
         rag_context = "\n\n---\n\n".join(rag_context_parts) if rag_context_parts else ""
         print(f'   📚 RAG 컨텍스트 수집 완료: {len(rag_context):,}자', flush=True)
         
         # 2. 메모리 데이터에서 모든 과거 데이터 수집 (기준월 이전 모든 데이터)
-        all_months = sorted(full_data['snapshot_month'].unique().tolist())
-        available_months = [m for m in all_months if m <= base_month]
+        available_months = (
+            full_data.loc[full_data['snapshot_month'] <= base_month, 'snapshot_month']
+            .drop_duplicates().sort_values().tolist()
+        )
         
         print(f'   📅 분석 기간: {available_months[0]} ~ {available_months[-1]} ({len(available_months)}개월)', flush=True)
         
         # 3. GS차지비 전체 히스토리 데이터 추출
-        gs_data = full_data[full_data['CPO명'] == 'GS차지비'].copy()
-        gs_history = gs_data[gs_data['snapshot_month'].isin(available_months)].sort_values('snapshot_month')
+        gs_monthly = _gs_monthly(full_data)
+        if gs_monthly is None:
+            gs_monthly = full_data.iloc[0:0]
+        gs_history = gs_monthly[gs_monthly['snapshot_month'].isin(available_months)]
         
         # GS차지비 월별 추이 데이터
-        gs_trend_data = []
-        for _, row in gs_history.iterrows():
-            gs_trend_data.append({
-                'month': row.get('snapshot_month'),
-                'rank': int(row.get('순위', 0)) if pd.notna(row.get('순위')) else None,
-                'stations': int(row.get('충전소수', 0)) if pd.notna(row.get('충전소수')) else None,
-                'slow_chargers': int(row.get('완속충전기', 0)) if pd.notna(row.get('완속충전기')) else None,
-                'fast_chargers': int(row.get('급속충전기', 0)) if pd.notna(row.get('급속충전기')) else None,
-                'total_chargers': int(row.get('총충전기', 0)) if pd.notna(row.get('총충전기')) else None,
-                'market_share': float(row.get('시장점유율', 0)) * 100 if pd.notna(row.get('시장점유율')) and row.get('시장점유율') < 1 else float(row.get('시장점유율', 0)) if pd.notna(row.get('시장점유율')) else None,
-                'total_change': int(row.get('총증감', 0)) if pd.notna(row.get('총증감')) else None
-            })
+        gs_trend_data = [
+            {
+                'month': month,
+                'rank': _optional_int(rank),
+                'stations': _optional_int(stations),
+                'slow_chargers': _optional_int(slow),
+                'fast_chargers': _optional_int(fast),
+                'total_chargers': _optional_int(total),
+                'market_share': share,
+                'total_change': _optional_int(change)
+            }
+            for month, rank, stations, slow, fast, total, share, change in zip(
+                _column(gs_history, 'snapshot_month').tolist(),
+                _column(gs_history, '순위').tolist(),
+                _column(gs_history, '충전소수').tolist(),
+                _column(gs_history, '완속충전기').tolist(),
+                _column(gs_history, '급속충전기').tolist(),
+                _column(gs_history, '총충전기').tolist(),
+                _share_percents(_column(gs_history, '시장점유율')),
+                _column(gs_history, '총증감').tolist()
+            )
+        ]
         
         # 4. 전체 시장 데이터 추출
-        market_data = []
-        for month in available_months:
-            month_data = full_data[full_data['snapshot_month'] == month]
-            if len(month_data) > 0:
-                total_chargers = month_data['총충전기'].sum()
-                total_cpos = len(month_data[month_data['총충전기'] > 0])
-                market_data.append({
-                    'month': month,
-                    'total_chargers': int(total_chargers),
-                    'total_cpos': int(total_cpos)
-                })
+        # 월별 루프 대신 groupby 한 번으로 총충전기 합계와 운영 CPO 수(총충전기 > 0)를 집계
+        in_range = full_data[full_data['snapshot_month'].isin(available_months)]
+        monthly_market = pd.DataFrame({
+            'total_chargers': in_range['총충전기'],
+            'total_cpos': in_range['총충전기'] > 0
+        }).groupby(in_range['snapshot_month'], sort=True).sum()
+        market_data = [
+            {
+                'month': month,
+                'total_chargers': int(total_chargers),
+                'total_cpos': int(total_cpos)
+            }
+            for month, total_chargers, total_cpos in zip(
+                monthly_market.index.tolist(),
+                monthly_market['total_chargers'].tolist(),
+                monthly_market['total_cpos'].tolist()
+            )
+        ]
         
         # 5. 경쟁사 현황 (상위 10개사)
-        current_data = full_data[full_data['snapshot_month'] == base_month]
+        current_data = _month_rows(full_data, base_month)
         top10 = current_data.nlargest(10, '총충전기') if '총충전기' in current_data.columns else current_data.head(10)
         
-        competitor_info = []
-        for _, row in top10.iterrows():
-            competitor_info.append({
-                'name': row.get('CPO명', 'N/A'),
-                'rank': int(row.get('순위', 0)) if pd.notna(row.get('순위')) else None,
-                'total_chargers': int(row.get('총충전기', 0)) if pd.notna(row.get('총충전기')) else None,
-                'market_share': float(row.get('시장점유율', 0)) * 100 if pd.notna(row.get('시장점유율')) and row.get('시장점유율') < 1 else float(row.get('시장점유율', 0)) if pd.notna(row.get('시장점유율')) else None,
-                'total_change': int(row.get('총증감', 0)) if pd.notna(row.get('총증감')) else None
-            })
+        competitor_info = [
+            {
+                'name': name,
+                'rank': _optional_int(rank),
+                'total_chargers': _optional_int(total),
+                'market_share': share,
+                'total_change': _optional_int(change)
+            }
+            for name, rank, total, share, change in zip(
+                _column(top10, 'CPO명', 'N/A').tolist(),
+                _column(top10, '순위').tolist(),
+                _column(top10, '총충전기').tolist(),
+                _share_percents(_column(top10, '시장점유율')),
+                _column(top10, '총증감').tolist()
+            )
+        ]
         
         # 6. 미래 월 계산
-        from datetime import datetime
-        from dateutil.relativedelta import relativedelta
-        base_date = datetime.strptime(base_month, '%Y-%m')
-        future_months = []
-        for i in range(1, simulation_months + 1):
-            future_date = base_date + relativedelta(months=i)
-            future_months.append(future_date.strftime('%Y-%m'))
+        future_months = pd.period_range(
+            start=pd.Period(base_month, freq='M') + 1, periods=simulation_months, freq='M'
+        ).strftime('%Y-%m').tolist()
         
         # 7. AI 프롬프트 생성
         gs_trend_str = "\n".join([
@@ -1681,14 +2239,17 @@ GS차지비 {target_month} 포지션:
                 ]
             }
             
+            body = orjson.dumps(payload)
+            _bedrock_limiter.acquire(_estimate_tokens(body, payload['max_tokens']))
             response = self.bedrock_client.invoke_model(
                 modelId=Config.MODEL_ID,
                 contentType='application/json',
                 accept='application/json',
-                body=json.dumps(payload)
+                body=body
             )
             
-            response_body = json.loads(response['body'].read())
+            with closing(response['body']) as stream:
+                response_body = orjson.loads(stream.read())
             result_text = response_body['content'][0]['text']
             
             elapsed_time = time.time() - start_time
@@ -1696,8 +2257,7 @@ GS차지비 {target_month} 포지션:
             
             # 8. JSON 파싱
             # JSON 블록 추출
-            import re
-            json_match = re.search(r'```json\s*([\s\S]*?)\s*```', result_text)
+            json_match = _JSON_BLOCK_RE.search(result_text)
             if json_match:
                 json_str = json_match.group(1)
             else:
@@ -1720,17 +2280,15 @@ GS차지비 {target_month} 포지션:
             }
             
         except json.JSONDecodeError as e:
-            print(f'   ❌ JSON 파싱 오류: {e}', flush=True)
-            print(f'   📝 원본 응답: {result_text[:500]}...', flush=True)
+            logger.error('   ❌ JSON 파싱 오류: %s', e)
+            logger.error('   📝 원본 응답: %s...', result_text[:500])
             return {
                 'success': False,
                 'error': f'AI 응답 파싱 오류: {str(e)}',
                 'raw_response': result_text
             }
         except Exception as e:
-            print(f'   ❌ AI 예측 오류: {e}', flush=True)
-            import traceback
-            traceback.print_exc()
+            logger.exception('   ❌ AI 예측 오류: %s', e)
             return {
                 'success': False,
                 'error': str(e)
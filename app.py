@@ -1605,17 +1605,18 @@ def get_gs_chargebi_history():
         gs_data = cache['full_data'][cache['full_data']['CPO명'] == 'GS차지비'].copy()
         gs_data = gs_data.sort_values('snapshot_month')
         
+        # 필요한 컬럼만 튜플로 순회 (없는 컬럼은 NaN → 기본값 처리)
         history = []
-        for _, row in gs_data.iterrows():
-            market_share = row.get('시장점유율', 0)
+        columns = gs_data.reindex(columns=['snapshot_month', '시장점유율', '총충전기', '순위'])
+        for month, market_share, total_chargers, rank in columns.itertuples(index=False, name=None):
             if pd.notna(market_share) and market_share < 1:
                 market_share = market_share * 100
             
             history.append({
-                'month': row.get('snapshot_month'),
+                'month': month,
                 'market_share': round(float(market_share), 2) if pd.notna(market_share) else 0,
-                'total_chargers': int(row.get('총충전기', 0)) if pd.notna(row.get('총충전기')) else 0,
-                'rank': int(row.get('순위', 0)) if pd.notna(row.get('순위')) else None
+                'total_chargers': int(total_chargers) if pd.notna(total_chargers) else 0,
+                'rank': int(rank) if pd.notna(rank) else None
             })
         
         return jsonify({
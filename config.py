@@ -19,11 +19,37 @@ class Config:
     MODEL_ID = os.getenv('MODEL_ID', 'global.anthropic.claude-sonnet-4-5-20250929-v1:0')
     ANTHROPIC_VERSION = 'bedrock-2023-05-31'
     MAX_TOKENS = 5120  # 성능 최적화: 6144 → 5120
+    SUMMARY_MAX_TOKENS = 3072  # 짧은 요약 섹션(GS차지비 경영진 요약) 출력 상한
     TEMPERATURE = 0.7
+    # on_chunk 콜백이 없는 호출도 스트리밍 응답으로 받을지 여부 (opt-in, bedrock:InvokeModelWithResponseStream 권한 필요)
+    # 기본값 false: 콜백을 넘긴 호출만 스트리밍, 나머지는 invoke_model
+    BEDROCK_STREAMING = os.getenv('BEDROCK_STREAMING', 'false').lower() == 'true'
+    # Bedrock 프롬프트 캐싱 (system 규칙/KB 컨텍스트에 cache_control 지정, 미지원 모델은 false)
+    PROMPT_CACHING = os.getenv('PROMPT_CACHING', 'true').lower() == 'true'
     
     # Knowledge Base 설정
     KNOWLEDGE_BASE_ID = os.getenv('KNOWLEDGE_BASE_ID', 'XHG5MMFIYK')
     KB_NUMBER_OF_RESULTS = 100  # RAG 모든 데이터 활용 (AWS 최대값: 100)
+    # 리포트 섹션들이 공통 KB 쿼리 1회를 공유 (false면 섹션별 쿼리로 개별 검색)
+    KB_SHARED_QUERY = os.getenv('KB_SHARED_QUERY', 'true').lower() == 'true'
+    
+    # 프롬프트에 삽입하는 분석 데이터 최대 길이 (문자 수, 약 4자 ≈ 1토큰)
+    PROMPT_DATA_MAX_CHARS = 80000
+    
+    # Bedrock 호출 속도 제한 (계정 쿼터 이하로 유지, 0이면 제한 없음)
+    BEDROCK_RPM = int(os.getenv('BEDROCK_RPM', '60'))  # 분당 요청 수
+    BEDROCK_TPM = int(os.getenv('BEDROCK_TPM', '0'))  # 분당 토큰 수 (입력 추정치 + max_tokens)
+    
+    # 응답 캐시 설정 (동일 프롬프트/쿼리 재호출 방지)
+    RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', '3600'))  # 초 단위, 0이면 비활성화
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '256'))  # LRU 최대 항목 수, 0이면 무제한
+    
+    # boto3 클라이언트 설정 (공유 클라이언트 커넥션 풀 / 재시도)
+    BOTO_MAX_POOL_CONNECTIONS = 50
+    # adaptive 모드: 스로틀링 시 클라이언트 측 속도 조절 (병렬 섹션 생성 시 ThrottlingException 흡수)
+    BOTO_MAX_ATTEMPTS = int(os.getenv('BOTO_MAX_ATTEMPTS', '5'))
+    BOTO_CONNECT_TIMEOUT = 5  # 초 단위 (연결 지연 시 기본 60초 대기 대신 빠르게 재시도)
+    BOTO_READ_TIMEOUT = 120  # 초 단위 (기본 60초는 긴 리포트 생성 중 끊길 수 있음)
     
     # 데이터 설정
     HEADER_ROW = 4  # 0-based index (4번째 행이 헤더)
@@ -71,14 +71,15 @@ class ChargingDataAnalyzer:
         station_col = self._find_column(['충전소수', '충전소', 'station'])
         
         if charger_col and station_col:
-            analysis = self.df.groupby(cpo_col).agg({
+            # CPO명이 category일 때 해당 데이터에 없는 CPO가 0행으로 붙지 않도록 observed=True
+            analysis = self.df.groupby(cpo_col, observed=True).agg({
                 station_col: 'sum',
                 charger_col: 'sum'
             }).reset_index()
             analysis.columns = ['CPO명', '충전소수', '총충전기']
             analysis = analysis.sort_values('총충전기', ascending=False).head(20)
         else:
-            analysis = self.df.groupby(cpo_col).size().reset_index(name='count')
+            analysis = self.df.groupby(cpo_col, observed=True).size().reset_index(name='count')
         
         # JSON 직렬화 가능하도록 변환
         return {
@@ -153,15 +154,16 @@ class ChargingDataAnalyzer:
             return {
                 'ranking': [
                     {
-                        'cpo': str(row[cpo_col]),
-                        'chargers': int(row[charger_col]) if pd.notna(row[charger_col]) else 0
+                        'cpo': str(cpo),
+                        'chargers': int(chargers) if pd.notna(chargers) else 0
                     }
-                    for _, row in top_df.iterrows()
+                    for cpo, chargers in top_df.itertuples(index=False, name=None)
                 ]
             }
         else:
             # 빈도 기준
-            top = self.df[cpo_col].value_counts().head(n)
+            # category 컬럼은 데이터에 없는 CPO도 0건으로 집계하므로 0건은 제외
+            top = self.df[cpo_col].value_counts()[lambda s: s > 0].head(n)
             return {str(k): int(v) for k, v in top.to_dict().items()}
     
     def _find_column(self, keywords):
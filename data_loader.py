@@ -375,6 +375,11 @@ class ChargingDataLoader:
         
         if all_data:
             combined_df = pd.concat(all_data, ignore_index=True)
+            
+            # CPO명은 수백 개 값이 월마다 반복되므로 category로 변환
+            # (CPO명 == 'GS차지비' 같은 필터가 문자열 비교 대신 정수 코드 비교로 수행됨)
+            if 'CPO명' in combined_df.columns:
+                combined_df['CPO명'] = combined_df['CPO명'].astype('category')
             print(f'\n✅ 총 {len(all_data)}개 파일, {len(combined_df)} 행 로드 완료')
             return combined_df
         